@@ -15,23 +15,35 @@ AGENTS.md 규칙:
 - stale lock 감지: PID/hostname 메타 + TTL 기반 정리
 """
 
+import ctypes
+import errno
+import functools
 import json
 import logging
 import os
+import select
+import shutil
 import socket
-import tempfile
+import struct
+import sys
+import threading
 import time
+import uuid
+from collections import OrderedDict
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from src.domain.constants import JOB_JSON_FILENAME
 from src.domain.errors import ErrorCodes, PolicyRejectError
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Stale lock threshold (seconds) - 1 hour
 STALE_LOCK_THRESHOLD_SECONDS = 3600
 
@@ -43,25 +55,48 @@ LOCK_META_FILENAME = "lock.meta"
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1)
 def _get_current_hostname() -> str:
-    """현재 호스트명 반환 (실패 시 'unknown')."""
+    """현재 호스트명 반환 (실패 시 'unknown'). 프로세스 단위로 캐시."""
     try:
         return socket.gethostname()
     except OSError:
         return "unknown"
 
 
+# 현재 프로세스 PID 캐시 (fork 시 자식에서 갱신)
+_current_pid = os.getpid()
+
+
+def _reset_process_cache() -> None:
+    """fork된 자식 프로세스에서 PID/hostname/디렉토리 캐시 갱신."""
+    global _current_pid, _known_dirs_lock
+    _current_pid = os.getpid()
+    _get_current_hostname.cache_clear()
+    # fork 시점에 다른 스레드가 잡고 있던 락을 물려받지 않도록 재생성
+    _known_dirs_lock = threading.Lock()
+    _known_dirs.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_process_cache)
+
+
 def _write_lock_meta(lock_dir: Path) -> None:
     """
     락 메타정보 파일 생성.
 
-    메타 내용: PID, hostname, created_at
+    메타 내용: PID, hostname, created_at_ns, created_at
+    - created_at_ns: epoch 나노초 (TTL 비교용, 파싱 불필요)
+    - created_at: ISO 문자열 (이전 버전 호환 및 가독성용)
     """
     meta_path = lock_dir / LOCK_META_FILENAME
+    created_at_ns = time.time_ns()
     meta = {
-        "pid": os.getpid(),
+        "pid": _current_pid,
         "hostname": _get_current_hostname(),
-        "created_at": datetime.now(UTC).isoformat(),
+        "created_at_ns": created_at_ns,
+        "created_at": datetime.fromtimestamp(created_at_ns / 1e9, UTC).isoformat(),
     }
     try:
         meta_path.write_text(json.dumps(meta), encoding="utf-8")
@@ -134,7 +169,12 @@ def _is_stale_lock(
             return False  # 프로세스 살아있음 → not stale
 
         # 다른 호스트: TTL 기반 (보수적)
-        # created_at 파싱 시도
+        created_at_ns = meta.get("created_at_ns")
+        if isinstance(created_at_ns, int):
+            age_ns = time.time_ns() - created_at_ns
+            return age_ns > threshold_seconds * 1_000_000_000
+
+        # 이전 버전 메타: created_at 파싱 시도
         try:
             created_str = meta.get("created_at", "")
             created_at = datetime.fromisoformat(created_str)
@@ -156,6 +196,10 @@ def _try_cleanup_stale_lock(lock_dir: Path) -> bool:
     """
     Stale lock 정리 시도.
 
+    stale 확인 → 삭제 → 재생성 사이의 경합(TOCTOU)을 막기 위해
+    락 디렉토리를 고유한 이름으로 rename하여 "선점"한 뒤 삭제함.
+    rename은 원자적이므로 동시에 정리를 시도해도 단 하나의 호출만 성공.
+
     Args:
         lock_dir: 락 디렉토리 경로
 
@@ -165,27 +209,128 @@ def _try_cleanup_stale_lock(lock_dir: Path) -> bool:
     if not _is_stale_lock(lock_dir):
         return False
 
-    meta = _read_lock_meta(lock_dir)
+    stale_dir = lock_dir.with_name(
+        f"{lock_dir.name}.stale.{_current_pid}.{uuid.uuid4().hex}"
+    )
+    try:
+        os.rename(lock_dir, stale_dir)
+    except OSError:
+        # 다른 프로세스가 먼저 정리했거나 rename 실패
+        return False
+
+    # 검사와 rename 사이에 새 락이 생성되었을 수 있으므로 재확인
+    if not _is_stale_lock(stale_dir):
+        try:
+            os.rename(stale_dir, lock_dir)
+        except OSError as e:
+            logger.warning(
+                f"Failed to restore live lock {lock_dir} from {stale_dir}: {e}"
+            )
+        return False
+
+    meta = _read_lock_meta(stale_dir)
     meta_info = ""
     if meta:
         meta_info = f" (owner: pid={meta.get('pid')}, host={meta.get('hostname')})"
 
     try:
-        # 메타 파일 먼저 삭제
-        meta_path = lock_dir / LOCK_META_FILENAME
-        if meta_path.exists():
-            meta_path.unlink()
+        shutil.rmtree(stale_dir)
+    except OSError as e:
+        logger.warning(f"Failed to remove stale lock directory {stale_dir}: {e}")
 
-        # 디렉토리 삭제
-        os.rmdir(lock_dir)
-        logger.warning(
-            f"Cleaned up stale lock: {lock_dir}{meta_info}. "
-            f"Lock exceeded TTL of {STALE_LOCK_THRESHOLD_SECONDS} seconds."
+    logger.warning(
+        f"Cleaned up stale lock: {lock_dir}{meta_info}. "
+        f"Lock exceeded TTL of {STALE_LOCK_THRESHOLD_SECONDS} seconds."
+    )
+    return True
+
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+_IN_MOVED_FROM = 0x00000040
+_IN_DELETE = 0x00000200
+
+# struct inotify_event 헤더: wd, mask, cookie, len (+ name[len])
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_libc() -> Any:
+    """inotify/linkat을 제공하는 libc 핸들 반환 (Linux 외/미지원 시 None)."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        libc.linkat.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_int,
+        ]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _wait_for_lock_release(lock_dir: Path, timeout: float) -> None:
+    """
+    락 디렉토리가 해제(삭제/rename)될 때까지 최대 timeout초 대기.
+
+    Linux에서는 부모 디렉토리를 inotify로 감시하여 해제 즉시 깨어나고,
+    그 외 환경이나 inotify 실패 시에는 time.sleep(timeout)으로 대체.
+
+    Args:
+        lock_dir: 락 디렉토리 경로
+        timeout: 최대 대기 시간 (초)
+    """
+    libc = _load_libc()
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC) if libc else -1
+    if fd < 0:
+        time.sleep(timeout)
+        return
+
+    try:
+        wd = libc.inotify_add_watch(
+            fd, os.fsencode(lock_dir.parent), _IN_DELETE | _IN_MOVED_FROM
         )
-        return True
-    except OSError:
-        # 디렉토리에 다른 파일이 있거나 삭제 실패
-        return False
+        if wd < 0:
+            time.sleep(timeout)
+            return
+
+        # watch 등록 전에 이미 해제되었으면 즉시 재시도
+        if not lock_dir.exists():
+            return
+
+        target = os.fsencode(lock_dir.name)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return
+            try:
+                buf = os.read(fd, 4096)
+            except BlockingIOError:
+                continue
+
+            offset = 0
+            while offset < len(buf):
+                _, _, _, name_len = _INOTIFY_EVENT.unpack_from(buf, offset)
+                offset += _INOTIFY_EVENT.size
+                name = buf[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+                if name == target:
+                    return
+    finally:
+        os.close(fd)
 
 
 def _cleanup_lock_dir(lock_dir: Path) -> None:
@@ -219,7 +364,8 @@ def job_lock(job_dir: Path, config: dict) -> Generator[Path, None, None]:
     동작:
     - 락 획득: os.mkdir() 원자적 생성 + 메타 파일(PID, hostname) 기록
     - 락 해제: 정상/예외 모두 메타 삭제 + rmdir() 호출
-    - timeout: config 기반 재시도
+    - timeout: 총 대기 시간(lock_max_retries * lock_retry_interval)까지 재시도
+      (Linux는 inotify로 해제 즉시 재시도)
     - stale lock: PID 생존 확인(동일 호스트) 또는 TTL 기반(다른 호스트) 정리
     - 해제 실패: warning 로그 남김
 
@@ -239,9 +385,11 @@ def job_lock(job_dir: Path, config: dict) -> Generator[Path, None, None]:
 
     lock_dir = job_dir / lock_dir_name
 
-    # 락 획득 시도
+    # 락 획득 시도 (총 대기 시간 기준: inotify로 일찍 깨어나도 시도 횟수를 소모하지 않음)
     acquired = False
-    for attempt in range(max_retries):
+    deadline = time.monotonic() + max_retries * interval
+    attempt = 0
+    while max_retries > 0:
         try:
             os.mkdir(lock_dir)
             acquired = True
@@ -258,7 +406,11 @@ def job_lock(job_dir: Path, config: dict) -> Generator[Path, None, None]:
                     break
                 except FileExistsError:
                     pass  # 다른 프로세스가 먼저 획득
-            time.sleep(interval)
+            attempt += 1
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _wait_for_lock_release(lock_dir, min(interval, remaining))
 
     if not acquired:
         raise PolicyRejectError(
@@ -288,20 +440,59 @@ def job_lock(job_dir: Path, config: dict) -> Generator[Path, None, None]:
 # =============================================================================
 
 
-def _fsync_dir(dir_path: Path) -> None:
+# macOS fcntl: F_BARRIERFSYNC (fsync + I/O barrier, F_FULLFSYNC보다 저렴)
+_F_BARRIERFSYNC = 85
+
+
+def _sync_file(fd: int) -> None:
+    """
+    파일 내용 동기화 (플랫폼별 최적 경로).
+
+    - macOS: F_BARRIERFSYNC (fsync(2)는 디스크 캐시를 비우지 않음)
+    - fdatasync 지원 플랫폼: fdatasync (불필요한 시간 메타데이터 동기화 생략)
+    - 그 외: fsync
+
+    Args:
+        fd: 동기화할 파일 디스크립터
+
+    Raises:
+        OSError: 동기화 실패 (호출 측에서 경고 처리)
+    """
+    if sys.platform == "darwin":
+        import fcntl
+
+        try:
+            fcntl.fcntl(fd, _F_BARRIERFSYNC, 0)
+            return
+        except OSError:
+            pass  # 미지원 파일시스템 → fsync로 대체
+        os.fsync(fd)
+    elif hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+
+def _default_fsync_dir(dir_path: Path) -> None:
     """
     디렉토리 fsync (가능한 환경에서).
 
     rename 후 디렉토리 엔트리까지 내구성을 강화하려면 필요.
     Linux에서 주로 유효하며, 일부 OS/파일시스템에서는 지원되지 않을 수 있음.
 
+    엔트리 내구성에는 디렉토리 inode의 시간 필드가 필요 없으므로
+    가능하면 fdatasync를 사용 (미지원 플랫폼은 fsync로 대체).
+
     Args:
         dir_path: fsync할 디렉토리 경로
     """
     try:
         dir_fd = os.open(str(dir_path), os.O_RDONLY | os.O_DIRECTORY)
         try:
-            os.fsync(dir_fd)
+            if hasattr(os, "fdatasync"):
+                os.fdatasync(dir_fd)
+            else:
+                os.fsync(dir_fd)
         finally:
             os.close(dir_fd)
     except (OSError, AttributeError) as e:
@@ -312,7 +503,75 @@ def _fsync_dir(dir_path: Path) -> None:
         )
 
 
-def atomic_write_json(path: Path, data: dict) -> None:
+# 디렉토리 fsync 구현 (컨텍스트별 교체 가능 - 테스트 격리용)
+_fsync_dir_impl: ContextVar[Callable[[Path], None]] = ContextVar(
+    "_fsync_dir_impl", default=_default_fsync_dir
+)
+
+
+def _fsync_dir(dir_path: Path) -> None:
+    """현재 컨텍스트의 디렉토리 fsync 구현 호출."""
+    _fsync_dir_impl.get()(dir_path)
+
+
+# SSOT 직렬화용 인코더 (호출마다 JSONEncoder 생성 생략)
+# NaN/Infinity는 표준 JSON이 아니므로 거부 (다른 파서가 읽지 못하는 job.json 방지)
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2, allow_nan=False)
+
+
+def _dumps_json(data: dict) -> bytes:
+    """
+    JSON 직렬화 (UTF-8, indent=2).
+
+    SSOT 파일은 설치된 선택 의존성과 무관하게 같은 바이트/같은 실패 조건을
+    가져야 하므로 표준 json 모듈만 사용 (orjson은 float 표기/큰 정수/NaN/
+    datetime 처리가 달라 사용하지 않음).
+
+    Raises:
+        TypeError: 직렬화 불가능한 값 (datetime 등)
+        ValueError: NaN/Infinity 값
+    """
+    return _JSON_ENCODER.encode(data).encode("utf-8")
+
+
+# 존재가 확인된 디렉토리 캐시 (반복 mkdir(parents=True) 생략, FIFO 상한)
+_KNOWN_DIRS_MAX = 1024
+_known_dirs: OrderedDict[str, None] = OrderedDict()
+_known_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(dir_path: Path) -> None:
+    """디렉토리 생성 (이미 확인된 디렉토리는 syscall 없이 통과)."""
+    key = str(dir_path)
+    if key in _known_dirs:
+        return
+    dir_path.mkdir(parents=True, exist_ok=True)
+    with _known_dirs_lock:
+        _known_dirs[key] = None
+        if len(_known_dirs) > _KNOWN_DIRS_MAX:
+            _known_dirs.popitem(last=False)
+
+
+def _retry_if_dir_vanished(dir_path: Path, func: Callable[[], _T]) -> _T:
+    """
+    func 실행 중 FileNotFoundError 발생 시 디렉토리 재생성 후 1회 재시도.
+
+    캐시된 디렉토리가 이후 삭제/이동된 경우(예: job 폴더 정리)를 처리.
+    """
+    try:
+        return func()
+    except FileNotFoundError:
+        with _known_dirs_lock:
+            _known_dirs.pop(str(dir_path), None)
+        _ensure_dir(dir_path)
+        return func()
+
+
+# Windows에서 텍스트 모드 변환 방지 (POSIX에는 없음)
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def atomic_write_json(path: Path, data: dict, *, mode: int | None = None) -> None:
     """
     원자적 JSON 쓰기.
 
@@ -330,29 +589,37 @@ def atomic_write_json(path: Path, data: dict) -> None:
     Args:
         path: 저장할 파일 경로
         data: JSON 직렬화할 데이터
+        mode: 파일 권한 (생성 시 커널이 현재 umask 적용). None이면 0o600
     """
+    # 직렬화 실패 시 temp 파일조차 만들지 않음
+    content = _dumps_json(data)
+
     dir_path = path.parent
-    dir_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(dir_path)
+
+    def _open_temp() -> tuple[Path, int]:
+        # 생성 시점에 권한 지정 (umask는 커널이 적용, O_EXCL로 기존 파일 보호)
+        temp = dir_path / f"tmp{uuid.uuid4().hex}.tmp"
+        fd = os.open(
+            temp,
+            os.O_CREAT | os.O_EXCL | os.O_WRONLY | _O_BINARY,
+            0o600 if mode is None else mode,
+        )
+        return temp, fd
 
     temp_path = None
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            dir=dir_path,
-            suffix=".tmp",
-            delete=False,
-            encoding="utf-8",
-        ) as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        temp_path, fd = _retry_if_dir_vanished(dir_path, _open_temp)
+        with open(fd, "wb") as f:
+            f.write(content)  # 단일 write
             f.flush()  # Python 버퍼 → OS 버퍼
             try:
-                os.fsync(f.fileno())  # OS 버퍼 → 디스크 (파일 내용)
+                _sync_file(f.fileno())  # OS 버퍼 → 디스크 (파일 내용)
             except OSError as e:
                 logger.warning(
                     f"File fsync failed for {path}: {e}. "
                     f"Data may not be durable on power loss."
                 )
-            temp_path = Path(f.name)
 
         os.rename(temp_path, path)  # 원자적
 
@@ -369,6 +636,87 @@ def atomic_write_json(path: Path, data: dict) -> None:
         raise
 
 
+# linkat(2) 플래그 (fcntl.h)
+_AT_FDCWD = -100
+_AT_EMPTY_PATH = 0x1000
+
+
+def _link_fd(fd: int, path: Path) -> bool:
+    """
+    이름 없는 파일(O_TMPFILE fd)을 path에 링크.
+
+    linkat(AT_EMPTY_PATH)을 먼저 시도하고 (CAP_DAC_READ_SEARCH 필요),
+    실패하면 /proc/self/fd 경유 linkat(AT_SYMLINK_FOLLOW)으로 재시도.
+
+    Returns:
+        True: 링크 성공, False: 이 환경에서 지원되지 않음
+
+    Raises:
+        FileExistsError: path가 이미 존재
+    """
+    libc = _load_libc()
+    if libc is not None:
+        target = os.fsencode(path)
+        if libc.linkat(fd, b"", _AT_FDCWD, target, _AT_EMPTY_PATH) == 0:
+            return True
+        err = ctypes.get_errno()
+        if err == errno.EEXIST:
+            raise FileExistsError(err, os.strerror(err), str(path))
+
+    try:
+        os.link(f"/proc/self/fd/{fd}", path)
+        return True
+    except FileExistsError:
+        raise
+    except OSError:
+        # /proc 미마운트, 권한/네임스페이스 제약 등
+        return False
+
+
+def _write_json_via_tmpfile(path: Path, content: bytes) -> bool | None:
+    """
+    O_TMPFILE에 쓰고 fsync 후 linkat으로 게시 (Linux).
+
+    완성된 파일만 path에 나타나므로 쓰기 도중의 불완전한 파일이
+    다른 프로세스에 보이지 않고, 실패 시 정리할 파일도 남지 않음.
+
+    Returns:
+        True: 새로 생성됨
+        False: 이미 존재함
+        None: O_TMPFILE/linkat 미지원 → 호출 측에서 O_EXCL 경로 사용
+    """
+    if not hasattr(os, "O_TMPFILE"):
+        return None
+
+    try:
+        fd = os.open(str(path.parent), os.O_TMPFILE | os.O_WRONLY, 0o644)
+    except OSError as e:
+        if e.errno in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+            return None
+        raise
+
+    try:
+        os.write(fd, content)
+
+        try:
+            _sync_file(fd)
+        except OSError as e:
+            logger.warning(
+                f"File fsync failed for {path}: {e}. "
+                f"Data may not be durable on power loss."
+            )
+
+        try:
+            if not _link_fd(fd, path):
+                return None
+        except FileExistsError:
+            # 파일 이미 존재 → 경합에서 다른 프로세스가 이김
+            return False
+        return True
+    finally:
+        os.close(fd)
+
+
 def atomic_write_json_exclusive(path: Path, data: dict) -> bool:
     """
     TOCTOU-safe 원자적 JSON 쓰기 (O_EXCL 패턴).
@@ -377,8 +725,9 @@ def atomic_write_json_exclusive(path: Path, data: dict) -> bool:
     exists() 체크 없이 O_CREAT | O_EXCL로 경합 윈도우를 제거함.
 
     동작:
-    1. O_CREAT | O_EXCL로 파일 생성 시도 (원자적)
-    2. 성공 시: 데이터 쓰기 + fsync
+    1. Linux: O_TMPFILE에 쓰기 + fsync 후 linkat으로 게시 (원자적)
+       - linkat은 대상이 있으면 실패 → False 반환
+    2. 그 외 (또는 O_TMPFILE 미지원): O_CREAT | O_EXCL로 생성 후 쓰기 + fsync
     3. FileExistsError 시: False 반환 (기존 파일 유지)
 
     사용 예시:
@@ -397,25 +746,39 @@ def atomic_write_json_exclusive(path: Path, data: dict) -> bool:
     Raises:
         OSError: 파일 시스템 오류 (권한, 디스크 풀 등)
     """
+    content = _dumps_json(data)
+
     dir_path = path.parent
-    dir_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(dir_path)
+
+    created = _retry_if_dir_vanished(
+        dir_path, functools.partial(_write_json_via_tmpfile, path, content)
+    )
+    if created is not None:
+        if created:
+            _fsync_dir(dir_path)  # 새 디렉토리 엔트리 내구성
+        return created
 
     try:
         # O_CREAT | O_EXCL: 파일이 없으면 생성, 있으면 FileExistsError
         # O_WRONLY: 쓰기 전용
-        fd = os.open(str(path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        fd = _retry_if_dir_vanished(
+            dir_path,
+            functools.partial(
+                os.open, str(path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644
+            ),
+        )
     except FileExistsError:
         # 파일 이미 존재 → 경합에서 다른 프로세스가 이김
         return False
 
     try:
         # 데이터 쓰기
-        content = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
         os.write(fd, content)
 
         # fsync (내구성)
         try:
-            os.fsync(fd)
+            _sync_file(fd)
         except OSError as e:
             logger.warning(
                 f"File fsync failed for {path}: {e}. "
@@ -41,6 +41,16 @@ class PolicyRejectError(Exception):
             **self.context,
         }
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """pickle 지원 (프로세스 풀 워커에서 전달될 때 code/context 보존)."""
+        return (_restore_policy_reject_error, (type(self), self.code, self.context))
+
+
+def _restore_policy_reject_error(
+    cls: type[PolicyRejectError], code: str, context: dict[str, Any]
+) -> PolicyRejectError:
+    return cls(code, **context)
+
 
 # =============================================================================
 # Error Codes (spec.md / runbook.md 참조)
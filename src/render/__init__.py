@@ -6,12 +6,14 @@ Render layer: DOCX/XLSX 출력 생성.
 - docxtpl (Word), openpyxl (Excel)
 """
 
-from .excel import ExcelRenderer, render_xlsx
-from .word import DocxRenderer, render_docx
+from .excel import ExcelRenderer, render_xlsx, render_xlsx_many
+from .word import DocxRenderer, render_docx, render_docx_many
 
 __all__ = [
     "render_docx",
+    "render_docx_many",
     "render_xlsx",
+    "render_xlsx_many",
     "DocxRenderer",
     "ExcelRenderer",
 ]
@@ -9,16 +9,113 @@ spec-v2.md Section 9.2 + ADR-0002 참조:
 - 측정 테이블: start_row 기반
 """
 
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from decimal import Decimal
+from io import BytesIO
 from pathlib import Path
 from typing import Any
+from zipfile import ZIP_DEFLATED, ZipFile
 
 import yaml
 from openpyxl import load_workbook
+from openpyxl.utils import column_index_from_string, coordinate_to_tuple
 from openpyxl.workbook import Workbook
+from openpyxl.writer.excel import ExcelWriter
 
 from src.domain.errors import ErrorCodes, PolicyRejectError
 
+# libyaml(C) 로더가 있으면 사용 (순수 Python SafeLoader 대비 수 배 빠름)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# 출력 xlsx DEFLATE 레벨: 단기 보관 성적서는 저장 속도 우선
+# (openpyxl 기본값 6 대비 2~3배 빠르고 용량은 20~30% 정도 증가)
+XLSX_COMPRESS_LEVEL = 1
+
+# =============================================================================
+# Template Cache
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _TemplateSource:
+    """
+    파싱된 템플릿 정보 (불변, 렌더러 간 공유).
+
+    Workbook 객체는 공유하면 안 되므로 원본 바이트와
+    Named Range 목적지 맵만 보관한다. 렌더링 시 raw에서 새 Workbook을 만든다.
+    """
+
+    raw: bytes
+    # range_name → ((sheet_name, "B2"), ...) - "$"와 범위 끝은 미리 제거
+    named_ranges: dict[str, tuple[tuple[str, str], ...]]
+    sheet_names: tuple[str, ...]
+    active_sheet: str
+
+
+@dataclass(frozen=True, slots=True)
+class _WritePlan:
+    """
+    manifest + 템플릿을 미리 해석한 쓰기 계획 (렌더링마다 재사용).
+
+    렌더링 시에는 manifest 해석 없이 (row, column, field) 목록만 순회한다.
+    """
+
+    # sheet_name → ((row, column, field), ...) - Named Range/Cell Address 통합
+    cells: tuple[tuple[str, tuple[tuple[int, int, str], ...]], ...]
+    # (sheet_name, start_row, ((field, column), ...)) - 측정 테이블 없으면 None
+    measurements: tuple[str, int, tuple[tuple[str, int], ...]] | None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_template_source(path: str, mtime_ns: int, size: int) -> _TemplateSource:
+    """
+    템플릿 바이트 + Named Range 맵 로드.
+
+    (path, mtime_ns, size)를 키로 캐싱하므로 템플릿 파일이 바뀌면 자동으로 다시 읽는다.
+    mtime_ns, size는 캐시 키 용도로만 사용.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    return _parse_template_source(raw)
+
+
+def _parse_template_source(raw: bytes) -> _TemplateSource:
+    """템플릿 바이트에서 Named Range 목적지 맵 추출."""
+    wb = load_workbook(BytesIO(raw), read_only=True)
+    try:
+        named_ranges = {
+            name: tuple(
+                # cell_ref가 범위일 수 있음 (예: $A$1:$A$1) → 첫 번째 셀만 사용
+                (sheet_name, cell_ref.replace("$", "").split(":")[0])
+                for sheet_name, cell_ref in defined_name.destinations
+            )
+            for name, defined_name in wb.defined_names.items()
+        }
+        sheet_names = tuple(wb.sheetnames)
+        active_sheet = wb.active.title
+    finally:
+        wb.close()
+
+    return _TemplateSource(
+        raw=raw,
+        named_ranges=named_ranges,
+        sheet_names=sheet_names,
+        active_sheet=active_sheet,
+    )
+
+
+def _get_template_source(template_path: Path) -> _TemplateSource:
+    """stat 기반 캐시 키로 템플릿 정보 조회."""
+    st = template_path.stat()
+    return _load_template_source(str(template_path), st.st_mtime_ns, st.st_size)
+
 
 class ExcelRenderer:
     """
@@ -29,42 +126,63 @@ class ExcelRenderer:
         renderer.render(data, output_path)
     """
 
-    def __init__(self, template_path: Path, manifest: dict[str, Any]):
+    def __init__(self, template_path: Path | bytes, manifest: dict[str, Any]):
         """
         Args:
-            template_path: XLSX 템플릿 파일 경로
+            template_path: XLSX 템플릿 파일 경로 또는 템플릿 파일 바이트
+                (바이트를 주면 파일시스템을 거치지 않음)
             manifest: manifest.yaml 내용 (xlsx_mappings 포함)
 
         Raises:
             PolicyRejectError: TEMPLATE_NOT_FOUND
         """
-        if not template_path.exists():
-            raise PolicyRejectError(
-                ErrorCodes.TEMPLATE_NOT_FOUND,
-                path=str(template_path),
-            )
+        self.template_path: Path | None
+        self._template_bytes: bytes | None
+        self._source: _TemplateSource | None = None
+        # (계획을 만든 템플릿, 계획) - 템플릿이 바뀌면 다시 만든다
+        self._plan: tuple[_TemplateSource, _WritePlan] | None = None
+
+        if isinstance(template_path, bytes):
+            self.template_path = None
+            self._template_bytes = template_path
+        else:
+            if not template_path.exists():
+                raise PolicyRejectError(
+                    ErrorCodes.TEMPLATE_NOT_FOUND,
+                    path=str(template_path),
+                )
+            self.template_path = template_path
+            self._template_bytes = None
 
-        self.template_path = template_path
         self.manifest = manifest
+        mappings = manifest.get("xlsx_mappings", {})
+        self._named_ranges: dict[str, str] = dict(mappings.get("named_ranges", {}))
+        self._cell_addresses: dict[str, str] = dict(mappings.get("cell_addresses", {}))
         self._validate_manifest()
 
+    def _get_source(self) -> _TemplateSource:
+        """템플릿 정보 조회 (바이트 템플릿은 인스턴스에 1회 파싱 후 재사용)."""
+        if self._template_bytes is None:
+            assert self.template_path is not None
+            return _get_template_source(self.template_path)
+
+        if self._source is None:
+            self._source = _parse_template_source(self._template_bytes)
+        return self._source
+
     def _validate_manifest(self) -> None:
         """
         manifest 검증: 동일 필드에 named_range + cell_address 둘 다 있으면 에러.
 
         ADR-0002: 둘 다 있으면 fail-fast
         """
-        mappings = self.manifest.get("xlsx_mappings", {})
-        named_ranges = set(mappings.get("named_ranges", {}).keys())
-        cell_addresses = set(mappings.get("cell_addresses", {}).keys())
-
-        # 교집합 확인
-        conflicts = named_ranges & cell_addresses
+        # 교집합 확인 (dict 키 뷰끼리 바로 교집합, 보고 순서는 정렬로 고정)
+        conflicts = sorted(self._named_ranges.keys() & self._cell_addresses.keys())
         if conflicts:
             raise PolicyRejectError(
                 ErrorCodes.RENDER_FAILED,
                 error="XLSX mapping conflict: same field in both named_ranges and cell_addresses",
-                fields=list(conflicts),
+                fields=conflicts,
             )
 
     def render(
@@ -88,18 +206,28 @@ class ExcelRenderer:
             PolicyRejectError: RENDER_FAILED
         """
         try:
-            # 템플릿 복사
-            wb = load_workbook(self.template_path)
+            # 템플릿 복사 (캐시된 바이트에서 로드 - 디스크 재읽기 없음)
+            source = self._get_source()
+            wb = load_workbook(BytesIO(source.raw))
+
+            # 값 변환은 진입 시 한 번만 (셀 쓰기 루프에서 타입 검사 제거)
+            data = _normalize_values(data)
+
+            # 쓰기 계획 (manifest 해석은 템플릿당 1회)
+            plan = self._get_plan(source)
 
             # 필드 채우기
-            self._fill_fields(wb, data)
+            self._fill_fields(wb, plan.cells, data)
 
             # 측정 데이터 채우기
-            self._fill_measurements(wb, data.get("measurements", []))
+            if plan.measurements is not None:
+                self._fill_measurements(
+                    wb, plan.measurements, data.get("measurements", [])
+                )
 
             # 저장
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            wb.save(output_path)
+            _save_workbook(wb, output_path)
 
             return output_path
 
@@ -108,104 +236,137 @@ class ExcelRenderer:
         except Exception as e:
             raise PolicyRejectError(
                 ErrorCodes.RENDER_FAILED,
-                template=str(self.template_path),
+                template=str(self.template_path or "<bytes>"),
                 error=str(e),
             ) from e
 
-    def _fill_fields(self, wb: Workbook, data: dict[str, Any]) -> None:
-        """필드 값 채우기 (Named Range 우선)."""
+    def _get_plan(self, source: _TemplateSource) -> _WritePlan:
+        """쓰기 계획 조회 (같은 템플릿이면 재사용)."""
+        if self._plan is None or self._plan[0] is not source:
+            self._plan = (source, self._build_plan(source))
+        return self._plan[1]
+
+    def _build_plan(self, source: _TemplateSource) -> _WritePlan:
+        """manifest 매핑을 템플릿 기준 (sheet, row, column)으로 미리 해석."""
         mappings = self.manifest.get("xlsx_mappings", {})
-        named_ranges = mappings.get("named_ranges", {})
-        cell_addresses = mappings.get("cell_addresses", {})
+        named_ranges = self._named_ranges
+        cell_addresses = self._cell_addresses
 
-        # 모든 필드 키 수집
-        all_fields = set(named_ranges.keys()) | set(cell_addresses.keys())
+        by_sheet: dict[str, list[tuple[int, int, str]]] = {}
 
-        for field in all_fields:
-            value = data.get(field)
-            if value is None:
-                continue
+        # 우선순위 1: Named Range
+        for field, range_name in named_ranges.items():
+            # Named Range가 템플릿에 없으면 무시 (fail-fast 대신 유연하게)
+            for sheet_name, cell_addr in source.named_ranges.get(range_name, ()):
+                row, col = coordinate_to_tuple(cell_addr)
+                by_sheet.setdefault(sheet_name, []).append((row, col, field))
 
-            # 우선순위 1: Named Range
+        # 우선순위 2: Cell Address - 형식: "Sheet1!B4" 또는 "B4" (기본 시트)
+        for field, cell_address in cell_addresses.items():
             if field in named_ranges:
-                self._set_named_range_value(wb, named_ranges[field], value)
-            # 우선순위 2: Cell Address
-            elif field in cell_addresses:
-                self._set_cell_value(wb, cell_addresses[field], value)
+                continue
+            if "!" in cell_address:
+                sheet_name, cell_ref = cell_address.split("!", 1)
+            else:
+                sheet_name, cell_ref = source.active_sheet, cell_address
+            row, col = coordinate_to_tuple(cell_ref)
+            by_sheet.setdefault(sheet_name, []).append((row, col, field))
 
-    def _set_named_range_value(
-        self,
-        wb: Workbook,
-        range_name: str,
-        value: Any,
-    ) -> None:
-        """Named Range에 값 설정."""
-        if range_name not in wb.defined_names:
-            # Named Range가 없으면 경고만 (fail-fast 대신 유연하게)
-            return
-
-        # Named Range의 목적지 가져오기
-        destinations = wb.defined_names[range_name].destinations
-        for sheet_name, cell_ref in destinations:
-            ws = wb[sheet_name]
-            # cell_ref가 범위일 수 있음 (예: $A$1:$A$1)
-            # 첫 번째 셀만 사용
-            cell_addr = cell_ref.replace("$", "").split(":")[0]
-            ws[cell_addr] = self._convert_value(value)
-
-    def _set_cell_value(
+        cells = tuple((sheet, tuple(writes)) for sheet, writes in by_sheet.items())
+
+        # 측정 테이블 (start_row 기반)
+        meas_config = mappings.get("measurements", {})
+        measurements = None
+        if meas_config:
+            sheet_name = meas_config.get("sheet", source.active_sheet)
+            if sheet_name not in source.sheet_names:
+                sheet_name = source.active_sheet
+            # 열 문자 → 인덱스는 한 번만 변환 (셀마다 "A5" 좌표 문자열 파싱 생략)
+            col_indices = tuple(
+                (field, column_index_from_string(col_letter))
+                for field, col_letter in meas_config.get("columns", {}).items()
+            )
+            measurements = (sheet_name, meas_config.get("start_row", 5), col_indices)
+
+        return _WritePlan(cells=cells, measurements=measurements)
+
+    def _fill_fields(
         self,
         wb: Workbook,
-        cell_address: str,
-        value: Any,
+        cells: tuple[tuple[str, tuple[tuple[int, int, str], ...]], ...],
+        data: dict[str, Any],
     ) -> None:
-        """직접 셀 주소에 값 설정."""
-        # 형식: "Sheet1!B4" 또는 "B4" (기본 시트)
-        if "!" in cell_address:
-            sheet_name, cell_ref = cell_address.split("!", 1)
-            ws = wb[sheet_name]
-        else:
-            ws = wb.active
-            cell_ref = cell_address
-
-        ws[cell_ref] = self._convert_value(value)
+        """필드 값 채우기 (Named Range 우선 - 계획에 반영됨)."""
+        for sheet_name, writes in cells:
+            ws = None
+            for row, col, field in writes:
+                value = data.get(field)
+                if value is None:
+                    continue
+                if ws is None:
+                    ws = wb[sheet_name]
+                ws.cell(row=row, column=col, value=value)
 
     def _fill_measurements(
         self,
         wb: Workbook,
+        plan: tuple[str, int, tuple[tuple[str, int], ...]],
         measurements: list[dict[str, Any]],
     ) -> None:
         """측정 데이터 채우기 (start_row 기반)."""
-        mappings = self.manifest.get("xlsx_mappings", {})
-        meas_config = mappings.get("measurements", {})
+        sheet_name, start_row, col_indices = plan
+        ws = wb[sheet_name]
+
+        # NOTE: openpyxl write-only 모드(Workbook(write_only=True))는 기존 템플릿을
+        # 열어 수정할 수 없어(스타일/병합/Named Range 유실) 여기서는 사용하지 않는다.
+        # 측정 테이블은 템플릿 시트 안의 start_row부터 채워야 하므로 일반 모드 유지.
 
-        if not meas_config:
-            return
+        for row_num, row_data in enumerate(measurements, start=start_row):
+            for field, col_idx in col_indices:
+                value = row_data.get(field)
+                if value is not None:
+                    ws.cell(row=row_num, column=col_idx, value=value)
 
-        sheet_name = meas_config.get("sheet", wb.active.title)
-        start_row = meas_config.get("start_row", 5)
-        columns = meas_config.get("columns", {})
 
-        try:
-            ws = wb[sheet_name]
-        except KeyError:
-            ws = wb.active
+# =============================================================================
+# Value Normalization
+# =============================================================================
 
-        for i, row_data in enumerate(measurements):
-            row_num = start_row + i
+# 타입 → 변환 함수 (정확한 타입 매칭 우선, 하위 클래스는 isinstance로 처리)
+# Excel은 Decimal을 직접 지원하지 않음 → float로 변환 (문자열이 더 안전할 수 있음)
+# date/datetime은 openpyxl이 직접 처리하므로 변환 불필요
+_VALUE_CONVERTERS: dict[type, Any] = {
+    Decimal: float,
+}
 
-            for field, col_letter in columns.items():
-                value = row_data.get(field)
-                if value is not None:
-                    ws[f"{col_letter}{row_num}"] = self._convert_value(value)
 
-    def _convert_value(self, value: Any) -> Any:
-        """값 변환 (Decimal → float 등)."""
-        if isinstance(value, Decimal):
-            # Excel은 Decimal을 직접 지원하지 않음
-            # float로 변환하되, 문자열이 더 안전할 수 있음
-            return float(value)
-        return value
+def _normalize_values(value: Any) -> Any:
+    """데이터 전체를 한 번 순회하며 Excel 비호환 값 변환 (dict/list 재귀)."""
+    converter = _VALUE_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    if isinstance(value, dict):
+        return {k: _normalize_values(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_normalize_values(v) for v in value]
+    if isinstance(value, Decimal):  # Decimal 하위 클래스
+        return float(value)
+    return value
+
+
+def _save_workbook(wb: Workbook, output_path: Path) -> None:
+    """
+    Workbook 저장 (openpyxl save_workbook과 동일하되 압축 레벨만 지정).
+    """
+    wb.properties.modified = datetime.now(UTC).replace(tzinfo=None)
+    with ZipFile(
+        output_path,
+        "w",
+        ZIP_DEFLATED,
+        allowZip64=True,
+        compresslevel=XLSX_COMPRESS_LEVEL,
+    ) as archive:
+        ExcelWriter(wb, archive).write_data()
 
 
 def render_xlsx(
@@ -230,6 +391,75 @@ def render_xlsx(
     return renderer.render(data, output_path)
 
 
+def render_xlsx_many(
+    jobs: list[tuple[Path, dict[str, Any], dict[str, Any], Path]],
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    여러 Excel 문서를 프로세스 풀에서 병렬 생성.
+
+    템플릿은 부모 프로세스에서 한 번씩만 읽어 바이트로 넘기므로
+    워커는 디스크를 다시 읽지 않는다.
+
+    Args:
+        jobs: (템플릿 경로, manifest, 데이터, 출력 경로) 목록
+        max_workers: 워커 수 (기본: min(작업 수, CPU 수))
+
+    Returns:
+        저장된 파일 경로 목록 (jobs 순서)
+
+    Raises:
+        PolicyRejectError: TEMPLATE_NOT_FOUND, RENDER_FAILED (첫 번째 실패)
+    """
+    if not jobs:
+        return []
+
+    template_bytes: dict[Path, bytes] = {}
+    for template_path, _, _, _ in jobs:
+        if template_path not in template_bytes:
+            if not template_path.exists():
+                raise PolicyRejectError(
+                    ErrorCodes.TEMPLATE_NOT_FOUND,
+                    path=str(template_path),
+                )
+            template_bytes[template_path] = template_path.read_bytes()
+
+    workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _render_xlsx_bytes,
+                template_path,
+                template_bytes[template_path],
+                manifest,
+                data,
+                out,
+            )
+            for template_path, manifest, data, out in jobs
+        ]
+        return [future.result() for future in futures]
+
+
+def _render_xlsx_bytes(
+    template_path: Path,
+    template_bytes: bytes,
+    manifest: dict[str, Any],
+    data: dict[str, Any],
+    output_path: Path,
+) -> Path:
+    """
+    프로세스 풀 워커: 바이트 템플릿으로 단일 문서 렌더링.
+
+    template_path는 에러 컨텍스트용 (바이트 렌더러는 "<bytes>"만 알고 있음).
+    """
+    try:
+        return ExcelRenderer(template_bytes, manifest).render(data, output_path)
+    except PolicyRejectError as e:
+        raise PolicyRejectError(
+            e.code, **{**e.context, "template": str(template_path)}
+        ) from e
+
+
 def load_manifest(manifest_path: Path) -> dict[str, Any]:
     """
     manifest.yaml 로드.
@@ -240,6 +470,7 @@ def load_manifest(manifest_path: Path) -> dict[str, Any]:
     Returns:
         manifest 내용
     """
-    with open(manifest_path, encoding="utf-8") as f:
-        data: dict[str, Any] = yaml.safe_load(f)
+    # 바이너리로 열어 디코딩은 YAML 로더에 맡김 (UTF-8/BOM 자동 감지)
+    with open(manifest_path, "rb") as f:
+        data: dict[str, Any] = yaml.load(f, Loader=_YamlLoader)  # nosec B506 (Safe 로더)
         return data
@@ -7,7 +7,12 @@ spec-v2.md Section 9.1 참조:
 - 이미지 삽입 지원
 """
 
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +21,18 @@ from docxtpl import DocxTemplate, InlineImage
 
 from src.domain.errors import ErrorCodes, PolicyRejectError
 
+# Optional: google-re2 (선형 시간 DFA 매칭, 큰 document.xml 스캔에 유리)
+try:
+    import re2 as _xml_re
+except ImportError:  # 선택 의존성 (pip install ".[perf]")
+    _xml_re = re
+
+# placeholder 빠른 추출용 (raw XML 스캔 - python-docx 객체 모델 생성 생략)
+_PLACEHOLDER_RE = _xml_re.compile(rb"\{\{\s*(\w+)\s*\}\}")
+_XML_TAG_RE = _xml_re.compile(rb"<[^>]*>")
+# docxtpl get_undeclared_template_variables와 같은 범위 (본문/머리글/바닥글만)
+_TEXT_PART_RE = re.compile(r"word/(document|header\d*|footer\d*)\.xml")
+
 
 class DocxRenderer:
     """
@@ -26,27 +43,43 @@ class DocxRenderer:
         renderer.render(data, output_path)
     """
 
-    def __init__(self, template_path: Path):
+    def __init__(self, template_path: Path | bytes):
         """
         Args:
-            template_path: DOCX 템플릿 파일 경로
+            template_path: DOCX 템플릿 파일 경로 또는 템플릿 파일 바이트
+                (바이트를 주면 파일시스템을 거치지 않음)
 
         Raises:
             PolicyRejectError: TEMPLATE_NOT_FOUND
         """
-        if not template_path.exists():
-            raise PolicyRejectError(
-                ErrorCodes.TEMPLATE_NOT_FOUND,
-                path=str(template_path),
-            )
+        self.template_path: Path | None
+        self._template_bytes: bytes | None
+
+        if isinstance(template_path, bytes):
+            self.template_path = None
+            self._template_bytes = template_path
+        else:
+            if not template_path.exists():
+                raise PolicyRejectError(
+                    ErrorCodes.TEMPLATE_NOT_FOUND,
+                    path=str(template_path),
+                )
+            self.template_path = template_path
+            self._template_bytes = None
 
-        self.template_path = template_path
         self._doc: DocxTemplate | None = None
 
+    def _template_source(self) -> Path | BytesIO:
+        """docxtpl/zipfile에 넘길 템플릿 소스 (경로 또는 메모리 버퍼)."""
+        if self._template_bytes is not None:
+            return BytesIO(self._template_bytes)
+        assert self.template_path is not None
+        return self.template_path
+
     def _load_template(self) -> DocxTemplate:
         """템플릿 로드 (lazy)."""
         if self._doc is None:
-            self._doc = DocxTemplate(self.template_path)
+            self._doc = DocxTemplate(self._template_source())
         return self._doc
 
     def render(
@@ -94,7 +127,7 @@ class DocxRenderer:
         except Exception as e:
             raise PolicyRejectError(
                 ErrorCodes.RENDER_FAILED,
-                template=str(self.template_path),
+                template=str(self.template_path or "<bytes>"),
                 error=str(e),
             ) from e
 
@@ -141,6 +174,14 @@ class DocxRenderer:
         Returns:
             placeholder 이름 목록 (예: ["wo_no", "line", ...])
         """
+        # 빠른 경로: 단순 {{ name }}만 있는 템플릿은 zip에서 XML을 직접 스캔
+        try:
+            simple = _scan_simple_placeholders(self._template_source())
+        except (OSError, zipfile.BadZipFile):
+            simple = None
+        if simple is not None:
+            return simple
+
         doc = self._load_template()
 
         # docxtpl의 undeclared_template_variables 활용
@@ -152,6 +193,32 @@ class DocxRenderer:
             return []
 
 
+def _scan_simple_placeholders(template: Path | BytesIO) -> list[str] | None:
+    """
+    DOCX 본문/머리글/바닥글 XML에서 {{ name }} placeholder 직접 추출.
+
+    Word가 placeholder를 여러 run으로 쪼개는 경우가 있으므로 태그를 지운 뒤 스캔.
+    {% %} 블록, 필터, 속성 접근 등 단순 변수가 아닌 Jinja2 문법이 있으면
+    None을 반환해 docxtpl 분석으로 넘긴다.
+    """
+    with zipfile.ZipFile(template) as zf:
+        parts = [
+            zf.read(name) for name in zf.namelist() if _TEXT_PART_RE.fullmatch(name)
+        ]
+
+    names: set[bytes] = set()
+    for xml in parts:
+        text = _XML_TAG_RE.sub(b"", xml)
+        if b"{%" in text or b"{#" in text:
+            return None
+        matches = _PLACEHOLDER_RE.findall(text)
+        if len(matches) != text.count(b"{{"):
+            return None
+        names.update(matches)
+
+    return sorted(name.decode("ascii") for name in names)
+
+
 def render_docx(
     template_path: Path,
     data: dict[str, Any],
@@ -172,3 +239,73 @@ def render_docx(
     """
     renderer = DocxRenderer(template_path)
     return renderer.render(data, output_path, photos)
+
+
+def render_docx_many(
+    jobs: list[tuple[Path, dict[str, Any], Path]],
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    여러 Word 문서를 프로세스 풀에서 병렬 생성.
+
+    템플릿은 부모 프로세스에서 한 번씩만 읽어 바이트로 넘기므로
+    워커는 디스크를 다시 읽지 않는다.
+
+    사진 삽입(render_docx의 photos)은 지원하지 않음 - 사진이 있는 문서는
+    render_docx로 생성.
+
+    Args:
+        jobs: (템플릿 경로, 데이터, 출력 경로) 목록
+        max_workers: 워커 수 (기본: min(작업 수, CPU 수))
+
+    Returns:
+        저장된 파일 경로 목록 (jobs 순서)
+
+    Raises:
+        PolicyRejectError: TEMPLATE_NOT_FOUND, RENDER_FAILED (첫 번째 실패)
+    """
+    if not jobs:
+        return []
+
+    template_bytes: dict[Path, bytes] = {}
+    for template_path, _, _ in jobs:
+        if template_path not in template_bytes:
+            if not template_path.exists():
+                raise PolicyRejectError(
+                    ErrorCodes.TEMPLATE_NOT_FOUND,
+                    path=str(template_path),
+                )
+            template_bytes[template_path] = template_path.read_bytes()
+
+    workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _render_docx_bytes,
+                template_path,
+                template_bytes[template_path],
+                data,
+                out,
+            )
+            for template_path, data, out in jobs
+        ]
+        return [future.result() for future in futures]
+
+
+def _render_docx_bytes(
+    template_path: Path,
+    template_bytes: bytes,
+    data: dict[str, Any],
+    output_path: Path,
+) -> Path:
+    """
+    프로세스 풀 워커: 바이트 템플릿으로 단일 문서 렌더링.
+
+    template_path는 에러 컨텍스트용 (바이트 렌더러는 "<bytes>"만 알고 있음).
+    """
+    try:
+        return DocxRenderer(template_bytes).render(data, output_path)
+    except PolicyRejectError as e:
+        raise PolicyRejectError(
+            e.code, **{**e.context, "template": str(template_path)}
+        ) from e
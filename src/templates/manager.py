@@ -9,11 +9,15 @@ ADR-0002 핵심 규칙:
 """
 
 import json
+import os
 import re
 import shutil
-from collections.abc import Generator
+import stat
+import string
+import sys
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
@@ -22,6 +26,18 @@ from typing import Any
 import yaml
 from filelock import FileLock, Timeout
 
+from src.core.ssot_job import atomic_write_json
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 (pip install ".[perf]")
+    orjson = None  # type: ignore[assignment]
+
 # =============================================================================
 # Exceptions
 # =============================================================================
@@ -50,10 +66,28 @@ class TemplateStatus(str, Enum):
     ARCHIVED = "archived"  # 폐기됨, 렌더 불가
 
 
+# meta.json 변환용 상태 ↔ 문자열 테이블 (Enum 생성자 조회 생략)
+_STATUS_TO_STR = {status: status.value for status in TemplateStatus}
+_STR_TO_STATUS = {status.value: status for status in TemplateStatus}
+
+
 # template_id 네이밍 규칙
 TEMPLATE_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_]*[a-z0-9]$")
 TEMPLATE_ID_MAX_LENGTH = 50
-FORBIDDEN_CHARS = set('/\\:*?"<>| ')
+FORBIDDEN_CHARS = set('/\\:*?"<>| \t\n\r')
+# 금지 문자 삭제용 translate 테이블 (길이가 줄면 금지 문자 포함)
+_FORBIDDEN_TABLE = str.maketrans("", "", "".join(FORBIDDEN_CHARS))
+# TEMPLATE_ID_PATTERN과 같은 규칙의 문자 집합 (검증 시 정규식 대신 사용)
+_TEMPLATE_ID_EDGE_CHARS = frozenset(string.ascii_lowercase + string.digits)
+# 허용 바이트 (bytes.translate 삭제 인자: 지우고 남는 바이트가 있으면 위반)
+_TEMPLATE_ID_BYTES = (string.ascii_lowercase + string.digits + "_").encode("ascii")
+
+
+def _loads_json(raw: bytes) -> Any:
+    """JSON 역직렬화 (orjson이 있으면 C 구현, 없으면 표준 json)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 # =============================================================================
@@ -69,7 +103,7 @@ def validate_template_id(template_id: str) -> None:
     - 소문자 + 숫자 + 언더스코어만 허용
     - 시작/끝은 소문자 또는 숫자
     - 최대 50자
-    - 금지 문자: / \\ : * ? " < > | 공백
+    - 금지 문자: / \\ : * ? " < > | 공백 (탭/개행 포함)
 
     Args:
         template_id: 검증할 ID
@@ -83,30 +117,61 @@ def validate_template_id(template_id: str) -> None:
             "template_id cannot be empty",
         )
 
-    if len(template_id) > TEMPLATE_ID_MAX_LENGTH:
+    if not isinstance(template_id, str):
+        raise TemplateError(
+            "INVALID_TEMPLATE_ID",
+            "template_id must be a string",
+            type=type(template_id).__name__,
+        )
+
+    length = len(template_id)
+
+    if length > TEMPLATE_ID_MAX_LENGTH:
         raise TemplateError(
             "INVALID_TEMPLATE_ID",
             f"template_id exceeds {TEMPLATE_ID_MAX_LENGTH} characters",
-            length=len(template_id),
+            length=length,
         )
 
+    # 길이/경계 문자 체크 (O(1)로 끝나는 거부를 먼저)
+    if (
+        length < 2
+        or template_id[0] not in _TEMPLATE_ID_EDGE_CHARS
+        or template_id[-1] not in _TEMPLATE_ID_EDGE_CHARS
+    ):
+        # 실패 경로에서만: 금지 문자가 원인이면 금지 문자 에러를 우선
+        _raise_if_forbidden(template_id)
+        raise _invalid_template_id_format()
+
     # 금지 문자 체크
-    found_forbidden = set(template_id) & FORBIDDEN_CHARS
-    if found_forbidden:
+    _raise_if_forbidden(template_id)
+
+    # 문자 체크 (ASCII 소문자/숫자/밑줄만): isascii는 O(1), 나머지는 C 루프 1회
+    if not template_id.isascii() or template_id.encode("ascii").translate(
+        None, _TEMPLATE_ID_BYTES
+    ):
+        raise _invalid_template_id_format()
+
+
+def _raise_if_forbidden(template_id: str) -> None:
+    """금지 문자 체크 (translate 1회 통과, 실패 시에만 어떤 문자인지 수집)."""
+    if len(template_id.translate(_FORBIDDEN_TABLE)) != len(template_id):
+        found_forbidden = set(template_id) & FORBIDDEN_CHARS
         raise TemplateError(
             "INVALID_TEMPLATE_ID",
             f"template_id contains forbidden characters: {found_forbidden}",
             forbidden=list(found_forbidden),
         )
 
-    # 패턴 체크
-    if not TEMPLATE_ID_PATTERN.match(template_id):
-        raise TemplateError(
-            "INVALID_TEMPLATE_ID",
-            "template_id must be lowercase alphanumeric with underscores, "
-            "start/end with alphanumeric",
-            pattern=TEMPLATE_ID_PATTERN.pattern,
-        )
+
+def _invalid_template_id_format() -> TemplateError:
+    """template_id 형식 위반 에러 생성."""
+    return TemplateError(
+        "INVALID_TEMPLATE_ID",
+        "template_id must be lowercase alphanumeric with underscores, "
+        "start/end with alphanumeric",
+        pattern=TEMPLATE_ID_PATTERN.pattern,
+    )
 
 
 def get_template_path(
@@ -133,7 +198,7 @@ def get_template_path(
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateMeta:
     """템플릿 메타데이터 (meta.json)."""
 
@@ -160,9 +225,7 @@ class TemplateMeta:
             "doc_type": self.doc_type,
             "display_name": self.display_name,
             "description": self.description,
-            "status": self.status.value
-            if isinstance(self.status, TemplateStatus)
-            else self.status,
+            "status": _STATUS_TO_STR.get(self.status, self.status),
             "version": self.version,
             "created_at": self.created_at,
             "created_by": self.created_by,
@@ -177,7 +240,8 @@ class TemplateMeta:
     def from_dict(cls, data: dict[str, Any]) -> "TemplateMeta":
         status = data.get("status", "draft")
         if isinstance(status, str):
-            status = TemplateStatus(status)
+            # 알 수 없는 값은 Enum 생성자로 넘겨 ValueError (기존 동작 유지)
+            status = _STR_TO_STATUS.get(status) or TemplateStatus(status)
 
         return cls(
             template_id=data["template_id"],
@@ -196,6 +260,86 @@ class TemplateMeta:
         )
 
 
+def _load_listed_meta(template_dir: str) -> TemplateMeta | None:
+    """
+    list_templates용 템플릿 폴더 1개의 메타데이터 로드.
+
+    meta.json이 없으면 manifest.yaml만 있는 base 템플릿으로 처리.
+    meta.json 형식이 잘못된 경우 None (목록에서 제외).
+    """
+    try:
+        with open(os.path.join(template_dir, "meta.json"), "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        # manifest.yaml만 있는 base 템플릿 처리
+        name = os.path.basename(template_dir)
+        try:
+            with open(
+                os.path.join(template_dir, "manifest.yaml"), encoding="utf-8"
+            ) as f:
+                manifest = yaml.safe_load(f)
+        except FileNotFoundError:
+            return None
+        return TemplateMeta(
+            template_id=manifest.get("template_id", name),
+            doc_type=manifest.get("doc_type", "unknown"),
+            display_name=manifest.get("display_name", name),
+            status=TemplateStatus.READY,
+        )
+
+    try:
+        return TemplateMeta.from_dict(_loads_json(raw))
+    except (json.JSONDecodeError, KeyError):
+        return None
+
+
+# readonly 해제 후 재시도할 삭제 함수 (rmtree는 open/scandir/lstat 실패도 전달)
+_RETRYABLE_REMOVE_FUNCS = (os.unlink, os.remove, os.rmdir)
+
+
+def _clear_readonly_and_retry(func: Callable[..., Any], path: str, exc: Any) -> None:
+    """
+    rmtree 에러 핸들러: readonly 해제 후 같은 삭제 함수 재시도 (Windows).
+
+    삭제 함수가 아닌 실패는 원래 예외를 그대로 다시 발생.
+    exc는 onexc면 예외 객체, onerror면 sys.exc_info() 튜플.
+    """
+    if func not in _RETRYABLE_REMOVE_FUNCS:
+        raise exc if isinstance(exc, BaseException) else exc[1]
+
+    mode = stat.S_IWRITE | stat.S_IREAD
+    if os.path.isdir(path):
+        mode |= stat.S_IEXEC  # 하위 항목 탐색 권한 유지
+    os.chmod(path, mode)
+    func(path)
+
+
+def _unlink_readonly(path: str) -> None:
+    """readonly 파일 삭제 (실패 시 무시)."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        try:
+            _clear_readonly_and_retry(os.remove, path, None)
+        except OSError:
+            pass
+
+
+def _rmtree_readonly(path: Path) -> None:
+    """
+    readonly 파일이 포함된 폴더 삭제.
+
+    Unix는 폴더 권한만 보므로 readonly 파일도 그대로 삭제되고,
+    실패한 항목(Windows readonly 등)만 핸들러에서 권한 해제 후 재시도.
+    """
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_clear_readonly_and_retry)
+    else:
+        shutil.rmtree(path, onerror=_clear_readonly_and_retry)
+
+
 # =============================================================================
 # Template Manager
 # =============================================================================
@@ -225,6 +369,11 @@ class TemplateManager:
         self.custom_dir = templates_root / "custom"
         self.base_dir = templates_root / "base"
         self._locks_dir = templates_root / ".locks"
+        # 내부 경로 연산용 문자열 (Path 객체 생성 없이 os.path 사용, 반환 시에만 Path)
+        self._custom_dir_str = str(self.custom_dir)
+        self._base_dir_str = str(self.base_dir)
+        # meta.json 경로 → (mtime_ns, size, TemplateMeta) 캐시
+        self._meta_cache: dict[str, tuple[int, int, TemplateMeta]] = {}
 
     @contextmanager
     def _template_lock(self, template_id: str) -> Generator[None, None, None]:
@@ -292,18 +441,21 @@ class TemplateManager:
 
         # 동시성 보호: 전체 생성 과정을 락으로 보호
         with self._template_lock(template_id):
-            # 중복 체크 (fail-fast)
-            template_path = self.custom_dir / template_id
-            if template_path.exists():
+            # 중복 체크 (fail-fast): 폴더 생성 자체가 존재 여부 판정
+            template_dir = os.path.join(self._custom_dir_str, template_id)
+            try:
+                os.makedirs(template_dir)
+            except FileExistsError:
                 raise TemplateError(
                     "TEMPLATE_EXISTS",
                     f"Template '{template_id}' already exists",
                     template_id=template_id,
-                )
+                ) from None
 
             # 폴더 구조 생성
-            (template_path / "source").mkdir(parents=True)
-            (template_path / "compiled").mkdir()
+            os.mkdir(os.path.join(template_dir, "source"))
+            os.mkdir(os.path.join(template_dir, "compiled"))
+            template_path = Path(template_dir)
 
             # 메타데이터 생성
             now = datetime.now(UTC).isoformat()
@@ -357,26 +509,31 @@ class TemplateManager:
         # 동시성 보호
         with self._template_lock(template_id):
             template_path = self._get_template_path(template_id)
-            source_dir = template_path / "source"
-            target = source_dir / filename
+            target = os.path.join(template_path, "source", filename)
 
-            # 불변 가드: 이미 존재하면 에러
-            if target.exists():
+            # 불변 가드: O_EXCL로 생성 → 이미 존재하면 커널이 거부 (검사-쓰기 경합 없음)
+            try:
+                fd = os.open(target, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o444)
+            except FileExistsError:
                 raise TemplateError(
                     "SOURCE_IMMUTABLE",
                     f"source/{filename} already exists. Cannot overwrite.",
                     template_id=template_id,
                     filename=filename,
-                )
+                ) from None
 
-            # 저장
-            target.write_bytes(file_bytes)
-
-            # readonly 설정 (Unix)
+            # 저장 (실패 시 불완전한 파일이 재시도를 막지 않도록 삭제)
             try:
-                target.chmod(0o444)  # r--r--r--
-            except OSError:
-                pass  # Windows에서는 무시
+                with os.fdopen(fd, "wb") as f:
+                    # readonly 설정: umask와 무관하게 r--r--r-- (Windows는 생성 모드로 충분)
+                    try:
+                        os.fchmod(f.fileno(), 0o444)
+                    except (AttributeError, OSError):
+                        pass
+                    f.write(file_bytes)
+            except BaseException:
+                _unlink_readonly(target)
+                raise
 
             # 메타데이터 업데이트
             meta = self.get_meta(template_id)
@@ -384,7 +541,7 @@ class TemplateManager:
             meta.updated_at = datetime.now(UTC).isoformat()
             self._save_meta(template_path, meta)
 
-            return target
+            return Path(target)
 
     def save_compiled(
         self,
@@ -406,17 +563,17 @@ class TemplateManager:
             저장된 파일 경로
         """
         template_path = self._get_template_path(template_id)
-        compiled_dir = template_path / "compiled"
-        target = compiled_dir / filename
+        target = os.path.join(template_path, "compiled", filename)
 
-        target.write_bytes(file_bytes)
+        with open(target, "wb") as f:
+            f.write(file_bytes)
 
         # 메타데이터 업데이트
         meta = self.get_meta(template_id)
         meta.updated_at = datetime.now(UTC).isoformat()
         self._save_meta(template_path, meta)
 
-        return target
+        return Path(target)
 
     # =========================================================================
     # Read
@@ -438,15 +595,24 @@ class TemplateManager:
         template_path = self._get_template_path(template_id)
         meta_path = template_path / "meta.json"
 
-        if not meta_path.exists():
+        try:
+            st = meta_path.stat()
+        except FileNotFoundError:
             raise TemplateError(
                 "TEMPLATE_NOT_FOUND",
                 f"meta.json not found for '{template_id}'",
                 template_id=template_id,
-            )
+            ) from None
 
-        data = json.loads(meta_path.read_text(encoding="utf-8"))
-        return TemplateMeta.from_dict(data)
+        # 파일이 바뀌지 않았으면 캐시 사용 (호출자가 수정할 수 있으므로 복사본 반환)
+        key = str(meta_path)
+        cached = self._meta_cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return replace(cached[2])
+
+        meta = TemplateMeta.from_dict(_loads_json(meta_path.read_bytes()))
+        self._meta_cache[key] = (st.st_mtime_ns, st.st_size, meta)
+        return replace(meta)
 
     def get_manifest(self, template_id: str) -> dict[str, Any]:
         """
@@ -483,52 +649,32 @@ class TemplateManager:
         Returns:
             TemplateMeta 목록
         """
-        results = []
-
         dirs_to_scan = []
         if category in ("base", "all"):
             dirs_to_scan.append(self.base_dir)
         if category in ("custom", "all"):
             dirs_to_scan.append(self.custom_dir)
 
+        template_dirs: list[str] = []
         for scan_dir in dirs_to_scan:
-            if not scan_dir.exists():
+            try:
+                with os.scandir(str(scan_dir)) as it:
+                    template_dirs.extend(
+                        entry.path
+                        for entry in it
+                        if not entry.name.startswith(".") and entry.is_dir()
+                    )
+            except FileNotFoundError:
                 continue
 
-            for template_dir in scan_dir.iterdir():
-                if not template_dir.is_dir():
-                    continue
-                if template_dir.name.startswith("."):
-                    continue
-
-                meta_path = template_dir / "meta.json"
-                if not meta_path.exists():
-                    # manifest.yaml만 있는 base 템플릿 처리
-                    manifest_path = template_dir / "manifest.yaml"
-                    if manifest_path.exists():
-                        with open(manifest_path, encoding="utf-8") as f:
-                            manifest = yaml.safe_load(f)
-                        meta = TemplateMeta(
-                            template_id=manifest.get("template_id", template_dir.name),
-                            doc_type=manifest.get("doc_type", "unknown"),
-                            display_name=manifest.get(
-                                "display_name", template_dir.name
-                            ),
-                            status=TemplateStatus.READY,
-                        )
-                        if status is None or meta.status == status:
-                            results.append(meta)
-                    continue
-
-                try:
-                    data = json.loads(meta_path.read_text(encoding="utf-8"))
-                    meta = TemplateMeta.from_dict(data)
-                    if status is None or meta.status == status:
-                        results.append(meta)
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-        return results
+        # 변경되지 않은 meta.json은 get_meta와 같은 캐시 사용 (stat 1회로 끝)
+        # 상태 필터는 캐시된 객체로 판정, 반환 항목만 복사
+        metas = map(self._load_listed_meta_cached, template_dirs)
+        return [
+            replace(meta)
+            for meta in metas
+            if meta is not None and (status is None or meta.status == status)
+        ]
 
     # =========================================================================
     # Update
@@ -624,16 +770,9 @@ class TemplateManager:
                         status=meta.status.value,
                     )
 
-            # source/ 파일 readonly 해제 후 삭제
-            source_dir = template_path / "source"
-            if source_dir.exists():
-                for f in source_dir.iterdir():
-                    try:
-                        f.chmod(0o644)
-                    except OSError:
-                        pass
-
-            shutil.rmtree(template_path)
+            # source/ readonly 파일: 삭제 실패한 항목만 쓰기 권한 부여 후 재시도
+            _rmtree_readonly(template_path)
+            self._meta_cache.pop(str(template_path / "meta.json"), None)
 
     # =========================================================================
     # Internal Helpers
@@ -642,14 +781,14 @@ class TemplateManager:
     def _get_template_path(self, template_id: str) -> Path:
         """템플릿 경로 반환 (존재 확인)."""
         # custom 먼저 확인
-        path = self.custom_dir / template_id
-        if path.exists():
-            return path
+        path = os.path.join(self._custom_dir_str, template_id)
+        if os.path.exists(path):
+            return Path(path)
 
         # base 확인
-        path = self.base_dir / template_id
-        if path.exists():
-            return path
+        path = os.path.join(self._base_dir_str, template_id)
+        if os.path.exists(path):
+            return Path(path)
 
         raise TemplateError(
             "TEMPLATE_NOT_FOUND",
@@ -657,20 +796,49 @@ class TemplateManager:
             template_id=template_id,
         )
 
+    def _load_listed_meta_cached(self, template_dir: str) -> TemplateMeta | None:
+        """
+        list_templates용 메타데이터 로드 (meta.json stat 기반 캐시).
+
+        다른 프로세스/인스턴스의 변경도 mtime/size로 감지되므로
+        상태별 인덱스를 따로 유지하지 않고 파일을 기준으로 판정.
+        """
+        meta_path = os.path.join(template_dir, "meta.json")
+        try:
+            st = os.stat(meta_path)
+        except FileNotFoundError:
+            # manifest.yaml만 있는 base 템플릿 (캐시 대상 아님)
+            return _load_listed_meta(template_dir)
+
+        cached = self._meta_cache.get(meta_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+
+        meta = _load_listed_meta(template_dir)
+        if meta is not None:
+            self._meta_cache[meta_path] = (st.st_mtime_ns, st.st_size, meta)
+        return meta
+
     def _save_meta(self, template_path: Path, meta: TemplateMeta) -> Path:
-        """meta.json 저장."""
+        """meta.json 저장 (temp → rename 원자적 교체, 중간 상태 없음)."""
         meta_path = template_path / "meta.json"
-        meta_path.write_text(
-            json.dumps(meta.to_dict(), indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        # 다른 사용자/프로세스(웹 서버 등)도 읽을 수 있도록 일반 파일 권한
+        atomic_write_json(meta_path, meta.to_dict(), mode=0o666)
+        # 같은 mtime 틱 안의 재기록도 놓치지 않도록 캐시 항목 제거
+        self._meta_cache.pop(str(meta_path), None)
         return meta_path
 
     def _save_manifest(self, template_path: Path, manifest: dict[str, Any]) -> Path:
-        """manifest.yaml 저장."""
+        """manifest.yaml 저장 (libyaml C 에미터 사용 가능 시 사용, 출력 형식 동일)."""
         manifest_path = template_path / "manifest.yaml"
         with open(manifest_path, "w", encoding="utf-8") as f:
-            yaml.dump(manifest, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(
+                manifest,
+                f,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+            )
         return manifest_path
 
     def _default_manifest(self, template_id: str, doc_type: str) -> dict[str, Any]:
@@ -8,14 +8,28 @@ ADR-0002 2단계 접근:
 ⚠️ 검수 없는 100% 자동 생성은 금지 (유령버그 방지)
 """
 
+import functools
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Protocol
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Optional: regex (re 호환 API, 긴 예시 문서의 라벨 스캔에서 백트래킹에 강함)
+try:
+    import regex as _label_re
+except ImportError:  # 선택 의존성 (pip install ".[perf]")
+    _label_re = re
+
 # =============================================================================
 # Types
 # =============================================================================
@@ -117,12 +131,15 @@ def detect_placeholders(text: str) -> list[str]:
     Returns:
         placeholder 이름 목록
     """
+    # "{{"가 없으면 정규식 실행 없이 종료 (Level 2 완성본 대부분)
+    if "{{" not in text:
+        return []
     return PLACEHOLDER_PATTERN.findall(text)
 
 
 def has_placeholders(text: str) -> bool:
     """placeholder가 있는지 확인."""
-    return bool(PLACEHOLDER_PATTERN.search(text))
+    return "{{" in text and PLACEHOLDER_PATTERN.search(text) is not None
 
 
 # =============================================================================
@@ -130,23 +147,83 @@ def has_placeholders(text: str) -> bool:
 # =============================================================================
 
 # 라벨 → 필드 매핑 (definition.yaml aliases 기반으로 확장 가능)
+# 라벨 내부 공백은 같은 줄 {0,4}자로 제한 (임의 업로드 문서의 백트래킹 상한)
 DEFAULT_LABEL_PATTERNS = {
     # wo_no
-    r"(?:WO|W/O|작업지시|Work\s*Order)\s*(?:No\.?|번호)?": "wo_no",
+    r"(?:WO|W/O|작업지시|Work[ \t]{0,4}Order)[ \t]{0,4}(?:No\.?|번호)?": "wo_no",
     # line
-    r"(?:Line|라인)\s*(?:No\.?|번호)?": "line",
+    r"(?:Line|라인)[ \t]{0,4}(?:No\.?|번호)?": "line",
     # part_no
-    r"(?:Part|P/N|부품)\s*(?:No\.?|번호)?": "part_no",
+    r"(?:Part|P/N|부품)[ \t]{0,4}(?:No\.?|번호)?": "part_no",
     # lot
-    r"(?:Lot|로트)\s*(?:No\.?|번호)?": "lot",
+    r"(?:Lot|로트)[ \t]{0,4}(?:No\.?|번호)?": "lot",
     # result
     r"(?:Result|결과|판정)": "result",
     # inspector
-    r"(?:Inspector|검사자|담당자|Inspected\s*By)": "inspector",
+    r"(?:Inspector|검사자|담당자|Inspected[ \t]{0,4}By)": "inspector",
     # date
-    r"(?:Date|일자|검사일|Inspection\s*Date)": "date",
+    r"(?:Date|일자|검사일|Inspection[ \t]{0,4}Date)": "date",
 }
 
+# 라벨 뒤 구분자(":" 앞뒤) 공백 최대 길이 / 추출 값 최대 길이
+LABEL_SEPARATOR_MAX_SPACES = 8
+LABEL_VALUE_MAX_LENGTH = 120
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_label_pattern(pattern: str) -> Any:
+    """라벨 패턴 → 라벨 + 값 정규식 컴파일 (패턴별 1회)."""
+    # 라벨 + 값 패턴 (예: "WO No.: WO-001")
+    # 구분자 공백/값 길이에 상한을 둬 최악의 경우에도 선형 스캔
+    return _label_re.compile(
+        rf"({pattern})\s{{0,{LABEL_SEPARATOR_MAX_SPACES}}}[:：]?"
+        rf"\s{{0,{LABEL_SEPARATOR_MAX_SPACES}}}([^\n\r,;]{{1,{LABEL_VALUE_MAX_LENGTH}}})",
+        _label_re.IGNORECASE,
+    )
+
+
+def _compile_label_scan(
+    items: tuple[tuple[str, str], ...],
+) -> tuple[Any, tuple[tuple[Any, str], ...]]:
+    """
+    라벨 패턴 목록 컴파일 (1회 스캔용).
+
+    Returns:
+        (전체 라벨 1회 스캔용 alternation, (라벨 + 값 정규식, 필드명) 목록)
+    """
+    # 필드명은 그룹명으로 쓸 수 없을 수 있어 인덱스 기반 그룹명 사용
+    label_scan = _label_re.compile(
+        "|".join(f"(?P<_l{i}>{pattern})" for i, (pattern, _) in enumerate(items)),
+        _label_re.IGNORECASE,
+    )
+    label_regexes = tuple(
+        (_compile_label_pattern(pattern), field_name) for pattern, field_name in items
+    )
+    return label_scan, label_regexes
+
+
+# 기본 라벨 패턴은 모듈 로드 시 미리 컴파일
+# 1회 스캔은 leftmost-first alternation이라 다른 필드 라벨 안에서 시작하는 라벨을
+# 놓칠 수 있음 → 서로 겹치지 않는 기본 패턴에만 사용
+_DEFAULT_LABEL_SCAN = _compile_label_scan(tuple(DEFAULT_LABEL_PATTERNS.items()))
+
+
+def _to_detected_field(match: Any, field_name: str) -> DetectedField | None:
+    """라벨 + 값 매치 → DetectedField (빈 값이나 placeholder는 None)."""
+    label_text = match.group(1).strip()
+    value = match.group(2).strip()
+
+    # 빈 값이나 placeholder는 건너뛰기
+    if not value or PLACEHOLDER_PATTERN.match(value):
+        return None
+
+    return DetectedField(
+        field_name=field_name,
+        label_text=label_text,
+        original_value=value,
+        confidence=0.7,  # 규칙 기반은 중간 신뢰도
+    )
+
 
 def detect_labels_rule_based(
     text: str,
@@ -162,34 +239,125 @@ def detect_labels_rule_based(
     Returns:
         DetectedField 목록
     """
-    if patterns is None:
-        patterns = DEFAULT_LABEL_PATTERNS
+    if patterns is not None:
+        # 사용자 패턴은 서로 겹칠 수 있으므로 패턴별 finditer
+        results = []
+        for pattern, field_name in patterns.items():
+            for match in _compile_label_pattern(pattern).finditer(text):
+                detected = _to_detected_field(match, field_name)
+                if detected is not None:
+                    results.append(detected)
+        return results
+
+    label_scan, label_regexes = _DEFAULT_LABEL_SCAN
+
+    # 필드별 결과 (패턴 순서 유지) / 필드별 다음 검색 시작 위치
+    found: list[list[DetectedField]] = [[] for _ in label_regexes]
+    resume = [0] * len(label_regexes)
+
+    # 문서는 1회만 스캔하고, 라벨이 걸린 위치에서만 라벨 + 값 정규식 실행
+    # (필드별 finditer와 같은 결과: 값에 포함된 같은 필드 라벨은 건너뜀)
+    for label_match in label_scan.finditer(text):
+        index = int(label_match.lastgroup[2:])
+        start = label_match.start()
+        if start < resume[index]:
+            continue
+
+        label_regex, field_name = label_regexes[index]
+        match = label_regex.match(text, start)
+        if match is None:
+            continue
+        resume[index] = match.end()
+
+        detected = _to_detected_field(match, field_name)
+        if detected is not None:
+            found[index].append(detected)
+
+    return [detected for group in found for detected in group]
+
 
-    results = []
+# =============================================================================
+# Measurement Table Detection
+# =============================================================================
 
-    for pattern, field_name in patterns.items():
-        # 라벨 + 값 패턴 (예: "WO No.: WO-001")
-        full_pattern = rf"({pattern})\s*[:：]?\s*([^\n\r,;]+)"
-        matches = re.finditer(full_pattern, text, re.IGNORECASE)
+# 측정 테이블 헤더 키워드 (대소문자 무시)
+MEASUREMENT_KEYWORDS = ("SPEC", "MEASURED", "측정", "규격")
 
-        for match in matches:
-            label_text = match.group(1).strip()
-            value = match.group(2).strip()
+# 대소문자 구분이 없는 키워드(한글)는 원문에서 바로 검색, 나머지는 소문자로
+_CASELESS_MEASUREMENT_KEYWORDS = tuple(
+    kw for kw in MEASUREMENT_KEYWORDS if kw.lower() == kw.upper()
+)
+_CASED_MEASUREMENT_KEYWORDS = tuple(
+    kw.lower() for kw in MEASUREMENT_KEYWORDS if kw.lower() != kw.upper()
+)
 
-            # 빈 값이나 placeholder는 건너뛰기
-            if not value or PLACEHOLDER_PATTERN.match(value):
-                continue
 
-            results.append(
-                DetectedField(
-                    field_name=field_name,
-                    label_text=label_text,
-                    original_value=value,
-                    confidence=0.7,  # 규칙 기반은 중간 신뢰도
-                )
-            )
+def has_measurement_keywords(text: str) -> bool:
+    """
+    측정 테이블 헤더 키워드가 있는지 확인.
 
-    return results
+    한글 키워드는 원문 부분 문자열 검색으로 먼저 확인하고,
+    영문 키워드가 필요할 때만 text.lower()를 1회 생성.
+    """
+    if any(kw in text for kw in _CASELESS_MEASUREMENT_KEYWORDS):
+        return True
+    text_lower = text.lower()
+    return any(kw in text_lower for kw in _CASED_MEASUREMENT_KEYWORDS)
+
+
+# =============================================================================
+# Definition Loading
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _DefinitionIndex:
+    """definition.yaml 파싱 결과 + 필드명 집합 (캐시 공유, 읽기 전용)."""
+
+    definition: Mapping[str, Any]
+    known_fields: frozenset[str]
+    critical_fields: frozenset[str]
+
+
+def _freeze(value: Any) -> Any:
+    """YAML 파싱 결과를 읽기 전용으로 변환 (dict → MappingProxyType, list → tuple)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """_freeze의 역변환 (호출자가 수정해도 되는 독립 사본)."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@functools.lru_cache(maxsize=16)
+def _load_definition(path: str, mtime_ns: int, size: int) -> _DefinitionIndex:
+    """
+    definition.yaml 로드 + 필드명 집합 생성.
+
+    (path, mtime_ns, size) 키로 캐시 → 파일이 바뀌면 자동으로 다시 파싱.
+    캐시 결과는 모든 인스턴스가 공유하므로 읽기 전용으로 고정.
+    """
+    with open(path, "rb") as f:
+        definition = yaml.load(f, Loader=_YamlLoader)  # nosec B506 (Safe 로더)
+
+    fields = definition.get("fields", {})
+    return _DefinitionIndex(
+        definition=_freeze(definition),
+        known_fields=frozenset(fields),
+        critical_fields=frozenset(
+            name
+            for name, config in fields.items()
+            if config.get("importance") == "critical"
+        ),
+    )
 
 
 # =============================================================================
@@ -216,15 +384,21 @@ class TemplateScaffolder:
         """
         self.definition_path = definition_path
         self.llm_extractor = llm_extractor
-        self._definition: dict | None = None
+        self._definition_index: _DefinitionIndex | None = None
 
     @property
-    def definition(self) -> dict:
-        """definition.yaml 로드 (lazy)."""
-        if self._definition is None:
-            with open(self.definition_path, encoding="utf-8") as f:
-                self._definition = yaml.safe_load(f)
-        return self._definition
+    def definition(self) -> Mapping[str, Any]:
+        """definition.yaml 로드 (lazy, 읽기 전용 - 수정하려면 사본 사용)."""
+        return self._get_definition_index().definition
+
+    def _get_definition_index(self) -> _DefinitionIndex:
+        """definition.yaml 파싱 결과 (인스턴스당 stat 1회, 파싱은 모듈 캐시)."""
+        if self._definition_index is None:
+            st = self.definition_path.stat()
+            self._definition_index = _load_definition(
+                str(self.definition_path), st.st_mtime_ns, st.st_size
+            )
+        return self._definition_index
 
     def analyze_document(self, text: str) -> ScaffoldResult:
         """
@@ -256,13 +430,18 @@ class TemplateScaffolder:
         → 검수 권장하지만 필수는 아님
         """
         # placeholder가 definition.yaml 필드와 매칭되는지 확인
-        defined_fields = set(self.definition.get("fields", {}).keys())
-        matched = [p for p in placeholders if p in defined_fields]
-        unknown = [p for p in placeholders if p not in defined_fields]
+        defined_fields = self._get_definition_index().known_fields
+        placeholder_names = set(placeholders)
+        unknown = placeholder_names - defined_fields
 
         warnings = []
         if unknown:
-            warnings.append(f"Unknown placeholders (not in definition.yaml): {unknown}")
+            warnings.append(
+                f"Unknown placeholders (not in definition.yaml): {sorted(unknown)}"
+            )
+            matched = [p for p in placeholders if p in defined_fields]
+        else:
+            matched = placeholders
 
         # manifest 생성
         manifest = self._build_manifest_from_placeholders(matched)
@@ -278,7 +457,7 @@ class TemplateScaffolder:
                 )
                 for p in matched
             ],
-            detected_measurements="measurements" in placeholders,
+            detected_measurements="measurements" in placeholder_names,
             suggested_manifest=manifest,
             warnings=warnings,
             requires_review=False,  # Level 1은 검수 선택적
@@ -299,20 +478,12 @@ class TemplateScaffolder:
 
         # 필수 필드 누락 체크
         detected_names = {f.field_name for f in detected}
-        required_fields = [
-            name
-            for name, config in self.definition.get("fields", {}).items()
-            if config.get("importance") == "critical"
-        ]
-        missing = set(required_fields) - detected_names
+        missing = self._get_definition_index().critical_fields - detected_names
         if missing:
-            warnings.append(f"Critical fields not detected: {list(missing)}")
+            warnings.append(f"Critical fields not detected: {sorted(missing)}")
 
         # 측정 테이블 감지 (간단한 휴리스틱)
-        measurement_keywords = ["SPEC", "MEASURED", "측정", "규격"]
-        has_measurements = any(
-            kw.lower() in text.lower() for kw in measurement_keywords
-        )
+        has_measurements = has_measurement_keywords(text)
 
         # manifest 생성
         manifest = self._build_manifest_from_detected(detected)
@@ -343,9 +514,10 @@ class TemplateScaffolder:
         rule_result = self._scaffold_level2(text)
 
         # LLM 추출
+        # 추출기에는 수정 가능한 사본 전달 (캐시된 정의 보호)
         llm_detected = await self.llm_extractor.extract_fields(
             text,
-            self.definition.get("fields", {}),
+            _thaw(self.definition.get("fields", {})),
         )
 
         # 결과 병합 (LLM이 더 높은 confidence면 교체)
@@ -5,9 +5,11 @@ AGENTS.md 규칙에 따른 테스트 구성:
 - 정상 케이스, 필수 필드 누락 케이스 등 분리
 """
 
+import os
+import select
 import threading
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
 
 import pytest
@@ -159,6 +161,66 @@ def test_config() -> dict:
     }
 
 
+# =============================================================================
+# Process Fixtures
+# =============================================================================
+
+
+def _wait_procs(pids: list[int], timeout: float) -> list[int]:
+    """
+    자식 프로세스 종료 대기 (reap하지 않음 → 이후 join 가능).
+
+    Linux(pidfd_open 지원)에서는 pidfd + poll로 이벤트 기반 대기,
+    그 외 환경에서는 waitid(WNOWAIT) 폴링으로 대체.
+
+    Args:
+        pids: 대기할 자식 프로세스 PID 목록
+        timeout: 최대 대기 시간 (초)
+
+    Returns:
+        timeout 내에 종료되지 않은 PID 목록
+    """
+    deadline = time.monotonic() + timeout
+    pending = set(pids)
+
+    try:
+        pidfds = {os.pidfd_open(pid): pid for pid in pending}
+    except (AttributeError, OSError):
+        pidfds = None
+
+    if pidfds is not None:
+        poller = select.poll()
+        for fd in pidfds:
+            poller.register(fd, select.POLLIN)
+        try:
+            while pending:
+                remaining_ms = (deadline - time.monotonic()) * 1000
+                if remaining_ms <= 0:
+                    break
+                for fd, _ in poller.poll(remaining_ms):
+                    poller.unregister(fd)
+                    pending.discard(pidfds[fd])
+        finally:
+            for fd in pidfds:
+                os.close(fd)
+        return sorted(pending)
+
+    while pending and time.monotonic() < deadline:
+        for pid in list(pending):
+            info = os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+            if info is not None:
+                pending.discard(pid)
+        if pending:
+            time.sleep(0.005)
+    return sorted(pending)
+
+
+@pytest.fixture
+def wait_procs() -> Callable[[list[int], float], list[int]]:
+    """자식 프로세스 종료 대기 헬퍼 (pidfd_open + poll)."""
+    return _wait_procs
+
+
 # =============================================================================
 # Browser Test Fixtures
 # =============================================================================
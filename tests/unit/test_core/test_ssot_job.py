@@ -6,7 +6,9 @@ DoD:
 """
 
 import json
+import multiprocessing
 import os
+import sys
 import threading
 import time
 from datetime import UTC, datetime
@@ -30,6 +32,28 @@ from src.domain.errors import ErrorCodes, PolicyRejectError
 # =============================================================================
 
 
+def _lock_worker(
+    job_dir: Path, config: dict, name: str, queue: multiprocessing.Queue
+) -> None:
+    """별도 프로세스에서 락 획득 시도 후 결과를 큐에 기록."""
+    try:
+        with job_lock(job_dir, config):
+            queue.put((name, "success"))
+    except PolicyRejectError:
+        queue.put((name, "timeout"))
+
+
+def _lock_meta_worker(
+    job_dir: Path, config: dict, queue: multiprocessing.Queue
+) -> None:
+    """별도 프로세스에서 락 획득 후 (자신의 PID, 메타에 기록된 PID)를 큐에 기록."""
+    from src.core.ssot_job import LOCK_META_FILENAME
+
+    with job_lock(job_dir, config) as lock_dir:
+        meta = json.loads((lock_dir / LOCK_META_FILENAME).read_text())
+        queue.put((os.getpid(), meta["pid"]))
+
+
 class TestJobLock:
     """job_lock 컨텍스트 매니저 테스트."""
 
@@ -91,33 +115,114 @@ class TestJobLock:
         assert exc_info.value.code == ErrorCodes.JOB_JSON_LOCK_TIMEOUT
         assert "job_dir" in exc_info.value.context
 
-    def test_concurrent_lock_acquisition(self, tmp_path: Path, test_config: dict):
-        """동시 락 획득 시 한 쪽만 성공."""
+    @pytest.mark.skipif(
+        not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+    )
+    def test_waiter_wakes_on_lock_release(self, tmp_path: Path):
+        """락 해제 시 retry interval을 기다리지 않고 즉시 획득."""
         job_dir = tmp_path / "job"
         job_dir.mkdir()
 
-        results = []
-        barrier = threading.Barrier(2)
+        # 다른 프로세스가 보유 중인 락 시뮬레이션
+        lock_dir = job_dir / ".lock"
+        lock_dir.mkdir()
 
-        def try_lock(name: str):
-            barrier.wait()  # 동시 시작
-            try:
-                with job_lock(job_dir, test_config):
-                    time.sleep(0.1)  # 락 보유
-                    results.append(f"{name}:success")
-            except PolicyRejectError:
-                results.append(f"{name}:timeout")
+        config = {
+            "paths": {"lock_dir": ".lock"},
+            "pipeline": {
+                "lock_retry_interval": 5.0,
+                "lock_max_retries": 2,
+            },
+        }
 
-        t1 = threading.Thread(target=try_lock, args=("t1",))
-        t2 = threading.Thread(target=try_lock, args=("t2",))
+        releaser = threading.Timer(0.1, os.rmdir, args=(lock_dir,))
+        releaser.start()
+        start = time.monotonic()
+        try:
+            with job_lock(job_dir, config):
+                elapsed = time.monotonic() - start
+        finally:
+            releaser.join()
 
-        t1.start()
-        t2.start()
-        t1.join()
-        t2.join()
+        # interval(5초) 전체를 기다리지 않음
+        assert elapsed < 2.0
+
+    def test_waiter_survives_lock_churn(self, tmp_path: Path):
+        """다른 보유자의 해제로 일찍 깨어나도 총 대기 시간 전에 포기하지 않음."""
+        job_dir = tmp_path / "job"
+        job_dir.mkdir()
+        lock_dir = job_dir / ".lock"
+        lock_dir.mkdir()
+
+        config = {
+            "paths": {"lock_dir": ".lock"},
+            "pipeline": {
+                "lock_retry_interval": 0.5,
+                "lock_max_retries": 4,
+            },
+        }
+
+        timeouts = []
+
+        def early_wakeup(_lock_dir, timeout):
+            # churn 시뮬레이션: 해제 이벤트로 깨어났지만 다른 보유자가 먼저 재획득
+            timeouts.append(timeout)
+            time.sleep(0.01)
+
+        releaser = threading.Timer(0.3, os.rmdir, args=(lock_dir,))
+        releaser.start()
+        try:
+            with patch(
+                "src.core.ssot_job._wait_for_lock_release", side_effect=early_wakeup
+            ):
+                with job_lock(job_dir, config):
+                    pass
+        finally:
+            releaser.join()
+
+        # 시도 횟수(4)보다 많이 깨어났지만 타임아웃 없이 획득
+        assert len(timeouts) > 4
+        assert all(t <= 0.5 for t in timeouts)
+
+    def test_wait_falls_back_to_sleep(self, tmp_path: Path):
+        """inotify 미지원 환경에서는 sleep으로 대기."""
+        from src.core.ssot_job import _wait_for_lock_release
+
+        with (
+            patch("src.core.ssot_job._load_libc", return_value=None),
+            patch("src.core.ssot_job.time.sleep") as mock_sleep,
+        ):
+            _wait_for_lock_release(tmp_path / ".lock", 0.25)
+
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_concurrent_lock_acquisition(
+        self, tmp_path: Path, test_config: dict, wait_procs
+    ):
+        """동시 락 획득 시 한 쪽만 성공."""
+        job_dir = tmp_path / "job"
+        job_dir.mkdir()
+
+        queue: multiprocessing.Queue = multiprocessing.Queue()
+        procs = [
+            multiprocessing.Process(
+                target=_lock_worker, args=(job_dir, test_config, name, queue)
+            )
+            for name in ("p1", "p2")
+        ]
+        for p in procs:
+            p.start()
+
+        # 두 프로세스 종료까지 이벤트 기반 대기 (sleep 없음)
+        assert wait_procs([p.pid for p in procs], 10.0) == []
+        for p in procs:
+            p.join()
+            assert p.exitcode == 0
+
+        results = [queue.get(timeout=5) for _ in procs]
 
         # 둘 중 하나는 성공, 하나는 timeout
-        success_count = sum(1 for r in results if "success" in r)
+        success_count = sum(1 for _, r in results if r == "success")
 
         assert success_count >= 1  # 최소 1개 성공
         # Note: 타이밍에 따라 둘 다 성공할 수 있음 (순차적 획득)
@@ -152,6 +257,33 @@ class TestAtomicWriteJson:
         assert file_path.exists()
         assert file_path.parent.exists()
 
+    def test_known_parent_skips_mkdir(self, tmp_path: Path):
+        """이미 확인된 부모 디렉터리는 다시 mkdir하지 않음."""
+        file_path = tmp_path / "cached" / "test.json"
+
+        atomic_write_json(file_path, {"n": 1})
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            atomic_write_json(file_path, {"n": 2})
+
+        mock_mkdir.assert_not_called()
+        assert json.loads(file_path.read_text()) == {"n": 2}
+
+    def test_recreates_parent_removed_after_cache(self, tmp_path: Path):
+        """캐시 이후 부모 디렉터리가 삭제되어도 재생성 후 작성."""
+        import shutil
+
+        file_path = tmp_path / "vanishing" / "test.json"
+        atomic_write_json(file_path, {"n": 1})
+
+        shutil.rmtree(file_path.parent)
+        atomic_write_json(file_path, {"n": 2})
+        assert json.loads(file_path.read_text()) == {"n": 2}
+
+        shutil.rmtree(file_path.parent)
+        assert atomic_write_json_exclusive(file_path, {"n": 3}) is True
+        assert json.loads(file_path.read_text()) == {"n": 3}
+
     def test_overwrites_existing_file(self, tmp_path: Path):
         """기존 파일 덮어쓰기."""
         file_path = tmp_path / "test.json"
@@ -191,6 +323,60 @@ class TestAtomicWriteJson:
         loaded = json.loads(file_path.read_text())
         assert loaded == original_data
 
+    def test_mode_applies_umask(self, tmp_path: Path):
+        """mode 지정 → umask 적용 권한, 미지정 → temp 파일 기본값(0o600)."""
+        umask = os.umask(0)
+        os.umask(umask)
+
+        shared = tmp_path / "shared.json"
+        atomic_write_json(shared, {"k": 1}, mode=0o666)
+        private = tmp_path / "private.json"
+        atomic_write_json(private, {"k": 1})
+
+        assert shared.stat().st_mode & 0o777 == 0o666 & ~umask
+        assert private.stat().st_mode & 0o777 == 0o600
+
+    def test_mode_uses_current_umask(self, tmp_path: Path):
+        """import 이후 변경된 umask도 반영 (umask를 캐시하지 않음)."""
+        previous = os.umask(0o027)
+        try:
+            atomic_write_json(tmp_path / "shared.json", {"k": 1}, mode=0o666)
+        finally:
+            os.umask(previous)
+
+        assert (tmp_path / "shared.json").stat().st_mode & 0o777 == 0o640
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_output_matches_stdlib_format(self):
+        """직렬화 결과가 표준 json(indent=2) 형식과 동일 (float/큰 정수 포함)."""
+        from src.core.ssot_job import _dumps_json
+
+        data = {
+            "job_id": "JOB-001",
+            "nested": {"list": [1, 2.5, None, True], "empty": {}},
+            "floats": [1e16, 0.1, -0.0, 1.5e-7],
+            "big_int": 2**70,
+            "한글": "테스트",
+        }
+
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        assert _dumps_json(data) == expected
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_rejects_nan_and_infinity(self, tmp_path: Path, value: float):
+        """NaN/Infinity → ValueError, 파일/temp 파일 생성 안 함."""
+        file_path = tmp_path / "test.json"
+
+        with pytest.raises(ValueError):
+            atomic_write_json(file_path, {"value": value})
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejects_datetime(self, tmp_path: Path):
+        """datetime 등 JSON 타입이 아닌 값 → TypeError."""
+        with pytest.raises(TypeError):
+            atomic_write_json(tmp_path / "test.json", {"at": datetime.now(UTC)})
+
 
 # =============================================================================
 # verify_mismatch 테스트
@@ -418,7 +604,7 @@ class TestAtomicWriteFsyncFailure:
 
         caplog.set_level(logging.WARNING, logger="src.core.ssot_job")
 
-        with patch("os.fsync") as mock_fsync:
+        with patch("src.core.ssot_job._sync_file") as mock_fsync:
             mock_fsync.side_effect = OSError("I/O error")
 
             atomic_write_json(file_path, data)
@@ -434,7 +620,7 @@ class TestAtomicWriteFsyncFailure:
         file_path = tmp_path / "test.json"
         data = {"key": "value", "number": 42}
 
-        with patch("os.fsync") as mock_fsync:
+        with patch("src.core.ssot_job._sync_file") as mock_fsync:
             mock_fsync.side_effect = OSError("I/O error")
 
             atomic_write_json(file_path, data)
@@ -453,7 +639,7 @@ class TestAtomicWriteFsyncFailure:
 
         caplog.set_level(logging.WARNING, logger="src.core.ssot_job")
 
-        with patch("os.fsync") as mock_fsync:
+        with patch("src.core.ssot_job._sync_file") as mock_fsync:
             mock_fsync.side_effect = OSError("Disk full")
 
             atomic_write_json(file_path, data)
@@ -480,6 +666,53 @@ class TestAtomicWriteFsyncFailure:
         assert len(fsync_warnings) == 0
 
 
+class TestSyncFile:
+    """_sync_file 플랫폼별 동기화 경로 테스트."""
+
+    def test_uses_fdatasync_on_linux(self):
+        """Linux에서는 fdatasync 사용."""
+        from src.core.ssot_job import _sync_file
+
+        with (
+            patch("src.core.ssot_job.sys.platform", "linux"),
+            patch("os.fdatasync", create=True) as mock_fdatasync,
+            patch("os.fsync") as mock_fsync,
+        ):
+            _sync_file(3)
+
+        mock_fdatasync.assert_called_once_with(3)
+        mock_fsync.assert_not_called()
+
+    def test_uses_barrier_fsync_on_darwin(self):
+        """macOS에서는 F_BARRIERFSYNC 사용."""
+        pytest.importorskip("fcntl")
+        from src.core.ssot_job import _F_BARRIERFSYNC, _sync_file
+
+        with (
+            patch("src.core.ssot_job.sys.platform", "darwin"),
+            patch("fcntl.fcntl") as mock_fcntl,
+            patch("os.fsync") as mock_fsync,
+        ):
+            _sync_file(3)
+
+        mock_fcntl.assert_called_once_with(3, _F_BARRIERFSYNC, 0)
+        mock_fsync.assert_not_called()
+
+    def test_darwin_falls_back_to_fsync(self):
+        """F_BARRIERFSYNC 미지원 시 fsync로 대체."""
+        pytest.importorskip("fcntl")
+        from src.core.ssot_job import _sync_file
+
+        with (
+            patch("src.core.ssot_job.sys.platform", "darwin"),
+            patch("fcntl.fcntl", side_effect=OSError("not supported")),
+            patch("os.fsync") as mock_fsync,
+        ):
+            _sync_file(3)
+
+        mock_fsync.assert_called_once_with(3)
+
+
 # =============================================================================
 # 디렉토리 fsync 테스트
 # =============================================================================
@@ -523,6 +756,33 @@ class TestDirectoryFsync:
         ]
         assert len(dir_fsync_warnings) == 0
 
+    def test_dir_fdatasync_used(self, tmp_path: Path):
+        """디렉토리 동기화에 fdatasync를 사용하는지 확인."""
+        if not hasattr(os, "fdatasync"):
+            pytest.skip("fdatasync not available on this platform")
+
+        from src.core.ssot_job import _fsync_dir
+
+        with (
+            patch("os.fdatasync") as mock_fdatasync,
+            patch("os.fsync") as mock_fsync,
+        ):
+            _fsync_dir(tmp_path)
+
+        mock_fdatasync.assert_called_once()
+        mock_fsync.assert_not_called()
+
+    def test_dir_fd_closed_after_sync(self, tmp_path: Path):
+        """동기화 후 디렉토리 fd를 바로 닫음 (삭제된 job 폴더 fd를 잡아두지 않음)."""
+        from src.core.ssot_job import _fsync_dir
+
+        with patch("os.close", wraps=os.close) as mock_close:
+            _fsync_dir(tmp_path)
+
+        mock_close.assert_called_once()
+        with pytest.raises(OSError):
+            os.fstat(mock_close.call_args.args[0])
+
     def test_atomic_write_calls_dir_fsync(self, tmp_path: Path):
         """atomic_write_json이 디렉토리 fsync를 호출하는지 확인."""
         from src.core import ssot_job
@@ -531,17 +791,17 @@ class TestDirectoryFsync:
         data = {"key": "value"}
 
         dir_fsync_called = []
-        original_fsync_dir = ssot_job._fsync_dir
 
         def tracking_fsync_dir(dir_path):
             dir_fsync_called.append(dir_path)
-            return original_fsync_dir(dir_path)
+            return ssot_job._default_fsync_dir(dir_path)
 
-        ssot_job._fsync_dir = tracking_fsync_dir
+        # 모듈 전역 대신 현재 컨텍스트에만 적용
+        token = ssot_job._fsync_dir_impl.set(tracking_fsync_dir)
         try:
             atomic_write_json(file_path, data)
         finally:
-            ssot_job._fsync_dir = original_fsync_dir
+            ssot_job._fsync_dir_impl.reset(token)
 
         # 디렉토리 fsync가 호출됨
         assert len(dir_fsync_called) == 1
@@ -572,8 +832,31 @@ class TestStaleLockMeta:
             assert "pid" in meta
             assert "hostname" in meta
             assert "created_at" in meta
+            assert isinstance(meta["created_at_ns"], int)
             assert meta["pid"] == os.getpid()
 
+    def test_forked_child_writes_own_pid(
+        self, tmp_path: Path, test_config: dict, wait_procs
+    ):
+        """fork된 자식 프로세스는 캐시된 부모 PID가 아닌 자신의 PID를 기록."""
+        if not hasattr(os, "register_at_fork"):
+            pytest.skip("os.register_at_fork not available")
+
+        job_dir = tmp_path / "job"
+        job_dir.mkdir()
+
+        queue: multiprocessing.Queue = multiprocessing.get_context("fork").Queue()
+        proc = multiprocessing.get_context("fork").Process(
+            target=_lock_meta_worker, args=(job_dir, test_config, queue)
+        )
+        proc.start()
+        assert wait_procs([proc.pid], 10.0) == []
+        proc.join()
+
+        child_pid, meta_pid = queue.get(timeout=5)
+        assert meta_pid == child_pid
+        assert meta_pid != os.getpid()
+
     def test_lock_removes_meta_file_on_release(self, tmp_path: Path, test_config: dict):
         """락 해제 시 메타 파일이 삭제되는지 확인."""
         from src.core.ssot_job import LOCK_META_FILENAME
@@ -648,7 +931,7 @@ class TestStaleLockMeta:
         meta = {
             "pid": 12345,
             "hostname": "other-host-that-does-not-exist",
-            "created_at": datetime.now(UTC).isoformat(),
+            "created_at_ns": time.time_ns(),
         }
         (lock_dir / LOCK_META_FILENAME).write_text(json.dumps(meta))
 
@@ -656,15 +939,40 @@ class TestStaleLockMeta:
         assert _is_stale_lock(lock_dir) is False
 
         # 오래된 시간으로 변경
+        meta["created_at_ns"] = (
+            time.time_ns() - (STALE_LOCK_THRESHOLD_SECONDS + 100) * 1_000_000_000
+        )
+        (lock_dir / LOCK_META_FILENAME).write_text(json.dumps(meta))
+
+        # TTL 초과로 stale
+        assert _is_stale_lock(lock_dir) is True
+
+    def test_stale_lock_ttl_legacy_iso_meta(self, tmp_path: Path):
+        """created_at_ns 없는 이전 버전 메타는 ISO created_at으로 판단."""
         from datetime import timedelta
 
+        from src.core.ssot_job import (
+            LOCK_META_FILENAME,
+            STALE_LOCK_THRESHOLD_SECONDS,
+            _is_stale_lock,
+        )
+
+        lock_dir = tmp_path / ".lock"
+        lock_dir.mkdir()
+
+        meta = {
+            "pid": 12345,
+            "hostname": "other-host-that-does-not-exist",
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        (lock_dir / LOCK_META_FILENAME).write_text(json.dumps(meta))
+        assert _is_stale_lock(lock_dir) is False
+
         old_time = datetime.now(UTC) - timedelta(
             seconds=STALE_LOCK_THRESHOLD_SECONDS + 100
         )
         meta["created_at"] = old_time.isoformat()
         (lock_dir / LOCK_META_FILENAME).write_text(json.dumps(meta))
-
-        # TTL 초과로 stale
         assert _is_stale_lock(lock_dir) is True
 
     def test_cleanup_stale_lock_logs_owner_info(self, tmp_path: Path, caplog):
@@ -705,6 +1013,69 @@ class TestStaleLockMeta:
         assert "pid=999999999" in warning_logs[0]
         assert "host=test-host" in warning_logs[0]
 
+    def test_concurrent_stale_cleanup_only_one_wins(self, tmp_path: Path):
+        """여러 스레드가 동시에 stale lock 정리 시 하나만 성공."""
+        from src.core.ssot_job import (
+            LOCK_META_FILENAME,
+            _get_current_hostname,
+            _try_cleanup_stale_lock,
+        )
+
+        lock_dir = tmp_path / ".lock"
+        lock_dir.mkdir()
+
+        # 죽은 PID의 락 (stale)
+        meta = {
+            "pid": 999999999,
+            "hostname": _get_current_hostname(),
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        (lock_dir / LOCK_META_FILENAME).write_text(json.dumps(meta))
+
+        results = []
+        barrier = threading.Barrier(8)
+
+        def try_cleanup():
+            barrier.wait()  # 동시 시작
+            results.append(_try_cleanup_stale_lock(lock_dir))
+
+        threads = [threading.Thread(target=try_cleanup) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results.count(True) == 1
+        assert not lock_dir.exists()
+        # rename된 stale 디렉토리도 남지 않음
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cleanup_does_not_remove_live_lock(self, tmp_path: Path):
+        """rename 후 살아있는 락으로 확인되면 복원하고 정리하지 않음."""
+        from src.core.ssot_job import (
+            LOCK_META_FILENAME,
+            _get_current_hostname,
+            _try_cleanup_stale_lock,
+        )
+
+        lock_dir = tmp_path / ".lock"
+        lock_dir.mkdir()
+
+        meta = {
+            "pid": os.getpid(),
+            "hostname": _get_current_hostname(),
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        (lock_dir / LOCK_META_FILENAME).write_text(json.dumps(meta))
+
+        # 첫 검사는 stale로 판단했지만 rename 후 재확인 시 살아있는 락
+        with patch("src.core.ssot_job._is_stale_lock", side_effect=[True, False]):
+            assert _try_cleanup_stale_lock(lock_dir) is False
+
+        # 락은 원래 위치로 복원됨
+        assert (lock_dir / LOCK_META_FILENAME).exists()
+        assert [p.name for p in tmp_path.iterdir()] == [".lock"]
+
 
 # =============================================================================
 # atomic_write_json_exclusive 테스트 (O_EXCL 패턴)
@@ -807,6 +1178,39 @@ class TestAtomicWriteJsonExclusive:
         # 불완전한 파일이 남아있지 않아야 함
         assert not file_path.exists()
 
+    def test_tmpfile_publish_leaves_only_target(self, tmp_path: Path):
+        """O_TMPFILE 경로: 임시 파일 없이 대상 파일만 생성."""
+        from src.core.ssot_job import _write_json_via_tmpfile
+
+        file_path = tmp_path / "published.json"
+        content = json.dumps({"key": "value"}).encode("utf-8")
+
+        created = _write_json_via_tmpfile(file_path, content)
+        if created is None:
+            pytest.skip("O_TMPFILE/linkat not supported here")
+
+        assert created is True
+        assert [p.name for p in tmp_path.iterdir()] == ["published.json"]
+        assert file_path.read_bytes() == content
+
+        # 이미 존재하면 False, 기존 내용 유지
+        assert _write_json_via_tmpfile(file_path, b"{}") is False
+        assert file_path.read_bytes() == content
+
+    def test_falls_back_to_o_excl_when_tmpfile_unsupported(self, tmp_path: Path):
+        """O_TMPFILE 미지원 시 O_EXCL 경로로 동일하게 동작."""
+        file_path = tmp_path / "fallback.json"
+        data = {"key": "value"}
+
+        with patch(
+            "src.core.ssot_job._write_json_via_tmpfile", return_value=None
+        ) as mock_tmpfile:
+            assert atomic_write_json_exclusive(file_path, data) is True
+            assert atomic_write_json_exclusive(file_path, {"new": 1}) is False
+
+        assert mock_tmpfile.call_count == 2
+        assert json.loads(file_path.read_text(encoding="utf-8")) == data
+
     def test_fsync_failure_logs_warning(self, tmp_path: Path, caplog):
         """fsync 실패 시 warning 로그."""
         import logging
@@ -816,7 +1220,7 @@ class TestAtomicWriteJsonExclusive:
 
         caplog.set_level(logging.WARNING, logger="src.core.ssot_job")
 
-        with patch("os.fsync") as mock_fsync:
+        with patch("src.core.ssot_job._sync_file") as mock_fsync:
             mock_fsync.side_effect = OSError("I/O error")
             result = atomic_write_json_exclusive(file_path, data)
 
@@ -9,28 +9,34 @@ ADR-0002 검증:
 
 from decimal import Decimal
 from pathlib import Path
+from typing import Any
 
 import pytest
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.workbook.defined_name import DefinedName
 
 from src.domain.errors import ErrorCodes, PolicyRejectError
-from src.render.excel import ExcelRenderer, load_manifest, render_xlsx
+from src.render.excel import (
+    ExcelRenderer,
+    load_manifest,
+    render_xlsx,
+    render_xlsx_many,
+)
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def simple_xlsx_template(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def simple_xlsx_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    간단한 XLSX 템플릿 생성.
+    간단한 XLSX 템플릿 생성 (세션 당 1회, 읽기 전용으로 공유).
 
     - Named Range: WO_NO (B2), LINE (B3)
     - 일반 셀: B4 (result)
     """
-    template_path = tmp_path / "template.xlsx"
+    template_path = tmp_path_factory.mktemp("tpl") / "template.xlsx"
 
     wb = Workbook()
     ws = wb.active
@@ -51,15 +57,15 @@ def simple_xlsx_template(tmp_path: Path) -> Path:
     return template_path
 
 
-@pytest.fixture
-def xlsx_with_measurements_template(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def xlsx_with_measurements_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    측정 데이터 테이블이 있는 XLSX 템플릿.
+    측정 데이터 테이블이 있는 XLSX 템플릿 (세션 당 1회, 읽기 전용으로 공유).
 
     - 헤더: Row 4 (A: 항목, B: 규격, C: 측정값, D: 결과)
     - 데이터: Row 5부터
     """
-    template_path = tmp_path / "template_measurements.xlsx"
+    template_path = tmp_path_factory.mktemp("tpl") / "template_measurements.xlsx"
 
     wb = Workbook()
     ws = wb.active
@@ -83,9 +89,9 @@ def xlsx_with_measurements_template(tmp_path: Path) -> Path:
     return template_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_manifest() -> dict:
-    """기본 manifest."""
+    """기본 manifest (읽기 전용으로 공유)."""
     return {
         "template_id": "test_template",
         "xlsx_mappings": {
@@ -110,6 +116,19 @@ def sample_manifest() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def simple_xlsx_renderer(
+    simple_xlsx_template: Path,
+    sample_manifest: dict,
+) -> ExcelRenderer:
+    """
+    템플릿 바이트로 만든 공유 렌더러 (세션 당 1회).
+
+    render()는 매번 새 Workbook을 만들므로 테스트 간 공유해도 안전.
+    """
+    return ExcelRenderer(simple_xlsx_template.read_bytes(), sample_manifest)
+
+
 @pytest.fixture
 def conflicting_manifest() -> dict:
     """충돌하는 manifest (named_range + cell_address 동일 필드)."""
@@ -150,6 +169,18 @@ def sample_data() -> dict:
     }
 
 
+def _read_cells(
+    path: Path, coords: list[str], sheet: str | None = None
+) -> dict[str, Any]:
+    """출력 xlsx에서 지정 셀 값만 읽기 (read-only 스트리밍 로드 - 스타일 등 생략)."""
+    wb = load_workbook(path, read_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.active
+        return {coord: ws[coord].value for coord in coords}
+    finally:
+        wb.close()
+
+
 # =============================================================================
 # ExcelRenderer 초기화 테스트
 # =============================================================================
@@ -169,6 +200,23 @@ class TestExcelRendererInit:
         assert renderer.template_path == simple_xlsx_template
         assert renderer.manifest == sample_manifest
 
+    def test_init_with_template_bytes(
+        self,
+        simple_xlsx_template: Path,
+        sample_manifest: dict,
+        sample_data: dict,
+        tmp_path: Path,
+    ):
+        """템플릿 바이트로 초기화 → 파일 경로 렌더링과 동일 결과."""
+        renderer = ExcelRenderer(simple_xlsx_template.read_bytes(), sample_manifest)
+        assert renderer.template_path is None
+
+        output_path = tmp_path / "output.xlsx"
+        renderer.render(sample_data, output_path)
+
+        cells = _read_cells(output_path, ["B2", "B4"])
+        assert cells == {"B2": "WO-001", "B4": "PASS"}
+
     def test_init_with_nonexistent_template(
         self,
         tmp_path: Path,
@@ -208,13 +256,12 @@ class TestExcelRendererRender:
 
     def test_basic_render(
         self,
-        simple_xlsx_template: Path,
-        sample_manifest: dict,
+        simple_xlsx_renderer: ExcelRenderer,
         sample_data: dict,
         tmp_path: Path,
     ):
         """기본 렌더링."""
-        renderer = ExcelRenderer(simple_xlsx_template, sample_manifest)
+        renderer = simple_xlsx_renderer
         output_path = tmp_path / "output.xlsx"
 
         result = renderer.render(sample_data, output_path)
@@ -223,27 +270,23 @@ class TestExcelRendererRender:
         assert output_path.exists()
 
         # 렌더링 결과 확인
-        from openpyxl import load_workbook
-
-        wb = load_workbook(output_path)
-        ws = wb.active
+        cells = _read_cells(output_path, ["B2", "B3", "B4"])
 
         # Named Range로 채워진 값 확인
-        assert ws["B2"].value == "WO-001"  # WO_NO named range
-        assert ws["B3"].value == "L1"  # LINE named range
+        assert cells["B2"] == "WO-001"  # WO_NO named range
+        assert cells["B3"] == "L1"  # LINE named range
 
         # Cell Address로 채워진 값 확인
-        assert ws["B4"].value == "PASS"
+        assert cells["B4"] == "PASS"
 
     def test_creates_output_directory(
         self,
-        simple_xlsx_template: Path,
-        sample_manifest: dict,
+        simple_xlsx_renderer: ExcelRenderer,
         sample_data: dict,
         tmp_path: Path,
     ):
         """출력 디렉터리 자동 생성."""
-        renderer = ExcelRenderer(simple_xlsx_template, sample_manifest)
+        renderer = simple_xlsx_renderer
         output_path = tmp_path / "nested" / "dir" / "output.xlsx"
 
         renderer.render(sample_data, output_path)
@@ -279,13 +322,10 @@ class TestExcelRendererRender:
 
         renderer.render(sample_data, output_path)
 
-        from openpyxl import load_workbook
-
-        wb = load_workbook(output_path)
-        ws = wb.active
+        cells = _read_cells(output_path, ["B2", "B3"])
 
-        assert ws["B2"].value == "WO-001"  # Named Range
-        assert ws["B3"].value == "L1"  # Cell Address
+        assert cells["B2"] == "WO-001"  # Named Range
+        assert cells["B3"] == "L1"  # Cell Address
 
     def test_measurements_fill(
         self,
@@ -335,22 +375,23 @@ class TestExcelRendererRender:
 
         renderer.render(data, output_path)
 
-        from openpyxl import load_workbook
-
-        wb = load_workbook(output_path)
-        ws = wb["검사"]
+        cells = _read_cells(
+            output_path,
+            ["A5", "B5", "C5", "D5", "A6", "B6", "C6", "D6"],
+            sheet="검사",
+        )
 
         # Row 5 (첫 번째 측정 행)
-        assert ws["A5"].value == "길이"
-        assert ws["B5"].value == "10±0.1"
-        assert ws["C5"].value == 10.05  # Decimal → float
-        assert ws["D5"].value == "PASS"
+        assert cells["A5"] == "길이"
+        assert cells["B5"] == "10±0.1"
+        assert cells["C5"] == 10.05  # Decimal → float
+        assert cells["D5"] == "PASS"
 
         # Row 6 (두 번째 측정 행)
-        assert ws["A6"].value == "폭"
-        assert ws["B6"].value == "5±0.1"
-        assert ws["C6"].value == 5.02
-        assert ws["D6"].value == "PASS"
+        assert cells["A6"] == "폭"
+        assert cells["B6"] == "5±0.1"
+        assert cells["C6"] == 5.02
+        assert cells["D6"] == "PASS"
 
     def test_decimal_to_float_conversion(
         self,
@@ -369,13 +410,10 @@ class TestExcelRendererRender:
 
         renderer.render(data, output_path)
 
-        from openpyxl import load_workbook
-
-        wb = load_workbook(output_path)
-        ws = wb.active
+        cells = _read_cells(output_path, ["B2"])
 
-        assert ws["B2"].value == 123.456
-        assert isinstance(ws["B2"].value, float)
+        assert cells["B2"] == 123.456
+        assert isinstance(cells["B2"], float)
 
     def test_missing_named_range_ignored(
         self,
@@ -403,8 +441,7 @@ class TestExcelRendererRender:
 
     def test_render_with_korean(
         self,
-        simple_xlsx_template: Path,
-        sample_manifest: dict,
+        simple_xlsx_renderer: ExcelRenderer,
         tmp_path: Path,
     ):
         """한글 데이터 렌더링."""
@@ -414,19 +451,70 @@ class TestExcelRendererRender:
             "result": "합격",
         }
 
-        renderer = ExcelRenderer(simple_xlsx_template, sample_manifest)
         output_path = tmp_path / "output.xlsx"
 
-        renderer.render(data, output_path)
+        simple_xlsx_renderer.render(data, output_path)
+
+        cells = _read_cells(output_path, ["B2", "B3", "B4"])
+
+        assert cells["B2"] == "작업-001"
+        assert cells["B3"] == "라인A"
+        assert cells["B4"] == "합격"
+
+    def test_write_plan_reused_across_renders(
+        self,
+        simple_xlsx_template: Path,
+        sample_manifest: dict,
+        sample_data: dict,
+        tmp_path: Path,
+    ):
+        """manifest 해석(쓰기 계획)은 같은 템플릿이면 1회만."""
+        renderer = ExcelRenderer(simple_xlsx_template, sample_manifest)
+
+        renderer.render(sample_data, tmp_path / "out1.xlsx")
+        assert renderer._plan is not None
+        plan = renderer._plan[1]
+        renderer.render(sample_data, tmp_path / "out2.xlsx")
+
+        assert renderer._plan[1] is plan
+        assert dict(plan.cells)["Sheet1"] == (
+            (2, 2, "wo_no"),
+            (3, 2, "line"),
+            (4, 2, "result"),
+        )
+
+    def test_template_change_invalidates_cache(
+        self,
+        sample_data: dict,
+        tmp_path: Path,
+    ):
+        """템플릿 파일이 바뀌면 캐시된 Named Range 맵 대신 새 내용 사용."""
+        import os
+
+        template_path = tmp_path / "template.xlsx"
+        manifest = {"xlsx_mappings": {"named_ranges": {"wo_no": "WO_NO"}}}
+
+        wb = Workbook()
+        wb.active.title = "Sheet1"
+        wb.defined_names.add(DefinedName("WO_NO", attr_text="Sheet1!$B$2"))
+        wb.save(template_path)
 
-        from openpyxl import load_workbook
+        renderer = ExcelRenderer(template_path, manifest)
+        renderer.render(sample_data, tmp_path / "out1.xlsx")
 
-        wb = load_workbook(output_path)
-        ws = wb.active
+        # Named Range 위치 변경 (mtime도 확실히 달라지도록 지정)
+        wb = Workbook()
+        wb.active.title = "Sheet1"
+        wb.defined_names.add(DefinedName("WO_NO", attr_text="Sheet1!$C$7"))
+        wb.save(template_path)
+        st = template_path.stat()
+        os.utime(template_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
 
-        assert ws["B2"].value == "작업-001"
-        assert ws["B3"].value == "라인A"
-        assert ws["B4"].value == "합격"
+        renderer.render(sample_data, tmp_path / "out2.xlsx")
+
+        cells = _read_cells(tmp_path / "out2.xlsx", ["C7", "B2"])
+        assert cells["C7"] == "WO-001"
+        assert cells["B2"] is None
 
 
 # =============================================================================
@@ -489,6 +577,8 @@ class TestManifestValidation:
         fields = exc_info.value.context.get("fields", [])
         assert "wo_no" in fields
         assert "line" in fields
+        # 보고 순서는 정렬로 고정 (로그/에러 메시지 재현성)
+        assert fields == ["line", "wo_no"]
 
 
 # =============================================================================
@@ -519,6 +609,65 @@ class TestRenderXlsx:
         assert result == output_path
         assert output_path.exists()
 
+    def test_render_many(
+        self,
+        simple_xlsx_template: Path,
+        sample_manifest: dict,
+        sample_data: dict,
+        tmp_path: Path,
+    ):
+        """render_xlsx_many: 프로세스 풀 병렬 렌더링, 결과는 jobs 순서."""
+        jobs = [
+            (
+                simple_xlsx_template,
+                sample_manifest,
+                {**sample_data, "wo_no": f"WO-{i:03d}"},
+                tmp_path / f"out_{i}.xlsx",
+            )
+            for i in range(3)
+        ]
+
+        results = render_xlsx_many(jobs, max_workers=2)
+
+        assert results == [out for _, _, _, out in jobs]
+        for i, out in enumerate(results):
+            assert _read_cells(out, ["B2"])["B2"] == f"WO-{i:03d}"
+
+    def test_render_many_missing_template(
+        self,
+        sample_manifest: dict,
+        sample_data: dict,
+        tmp_path: Path,
+    ):
+        """render_xlsx_many: 템플릿 없으면 워커 시작 전 TEMPLATE_NOT_FOUND."""
+        missing = tmp_path / "missing.xlsx"
+
+        with pytest.raises(PolicyRejectError) as exc_info:
+            render_xlsx_many(
+                [(missing, sample_manifest, sample_data, tmp_path / "out.xlsx")]
+            )
+
+        assert exc_info.value.code == ErrorCodes.TEMPLATE_NOT_FOUND
+
+    def test_render_many_worker_error_reports_template_path(
+        self,
+        sample_manifest: dict,
+        sample_data: dict,
+        tmp_path: Path,
+    ):
+        """render_xlsx_many: 워커의 RENDER_FAILED 컨텍스트에 템플릿 경로."""
+        broken = tmp_path / "broken.xlsx"
+        broken.write_bytes(b"not an xlsx")
+
+        with pytest.raises(PolicyRejectError) as exc_info:
+            render_xlsx_many(
+                [(broken, sample_manifest, sample_data, tmp_path / "out.xlsx")]
+            )
+
+        assert exc_info.value.code == ErrorCodes.RENDER_FAILED
+        assert exc_info.value.context["template"] == str(broken)
+        assert "error" in exc_info.value.context
+
 
 # =============================================================================
 # load_manifest 테스트
@@ -559,3 +708,68 @@ display_name: 고객사A 검사성적서
         result = load_manifest(manifest_path)
 
         assert result["display_name"] == "고객사A 검사성적서"
+
+    def test_handles_utf8_bom(self, tmp_path: Path):
+        """BOM 포함 UTF-8 (메모장 저장 등)."""
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text("display_name: 검사성적서\n", encoding="utf-8-sig")
+
+        result = load_manifest(manifest_path)
+
+        assert result == {"display_name": "검사성적서"}
+
+    def test_rejects_python_tags(self, tmp_path: Path):
+        """Safe 로더만 사용 (임의 객체 생성 태그 거부)."""
+        import yaml
+
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text("x: !!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(yaml.YAMLError):
+            load_manifest(manifest_path)
+
+
+# =============================================================================
+# _normalize_values 테스트
+# =============================================================================
+
+
+class TestNormalizeValues:
+    """_normalize_values 값 변환 테스트."""
+
+    def test_converts_nested_decimals(self):
+        """중첩 dict/list의 Decimal → float, 나머지는 그대로."""
+        from datetime import date
+
+        from src.render.excel import _normalize_values
+
+        data = {
+            "wo_no": "WO-001",
+            "qty": 3,
+            "date": date(2024, 1, 15),
+            "measurements": [{"measured": Decimal("10.05"), "ok": True}],
+        }
+
+        result = _normalize_values(data)
+
+        assert result == {
+            "wo_no": "WO-001",
+            "qty": 3,
+            "date": date(2024, 1, 15),
+            "measurements": [{"measured": 10.05, "ok": True}],
+        }
+        assert type(result["measurements"][0]["measured"]) is float
+        # 원본은 변경하지 않음
+        assert data["measurements"][0]["measured"] == Decimal("10.05")
+
+    def test_converts_decimal_subclass(self):
+        """Decimal 하위 클래스도 float로 변환."""
+        from src.render.excel import _normalize_values
+
+        class Money(Decimal):
+            pass
+
+        result = _normalize_values({"price": Money("1.25"), "items": [Money("2")]})
+
+        assert result == {"price": 1.25, "items": [2.0]}
+        assert type(result["price"]) is float
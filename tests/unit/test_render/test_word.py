@@ -6,47 +6,59 @@ test_word.py - Word (DOCX) 렌더러 테스트
 - render_docx: 간편 함수
 """
 
+import zipfile
+from io import BytesIO
 from pathlib import Path
 
 import pytest
 from docx import Document
+from docxtpl import DocxTemplate
 
 from src.domain.errors import ErrorCodes, PolicyRejectError
-from src.render.word import DocxRenderer, render_docx
+from src.render.word import DocxRenderer, render_docx, render_docx_many
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def simple_docx_template(tmp_path: Path) -> Path:
+def _docx_bytes(doc) -> bytes:
+    """python-docx Document → 바이트."""
+    buf = BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def simple_docx_template_bytes() -> bytes:
     """
-    간단한 DOCX 템플릿 생성.
+    간단한 DOCX 템플릿 바이트 (세션 당 1회 생성).
 
     placeholder: {{wo_no}}, {{line}}, {{result}}
     """
-    template_path = tmp_path / "template.docx"
-
     doc = Document()
     doc.add_heading("검사 성적서", 0)
     doc.add_paragraph("작업번호: {{wo_no}}")
     doc.add_paragraph("라인: {{line}}")
     doc.add_paragraph("결과: {{result}}")
-    doc.save(template_path)
+    return _docx_bytes(doc)
+
 
+@pytest.fixture
+def simple_docx_template(tmp_path: Path, simple_docx_template_bytes: bytes) -> Path:
+    """간단한 DOCX 템플릿 (캐시된 바이트를 tmp_path에 기록)."""
+    template_path = tmp_path / "template.docx"
+    template_path.write_bytes(simple_docx_template_bytes)
     return template_path
 
 
-@pytest.fixture
-def template_with_measurements(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def template_with_measurements_bytes() -> bytes:
     """
-    측정 데이터를 포함하는 DOCX 템플릿.
+    측정 데이터를 포함하는 DOCX 템플릿 바이트 (세션 당 1회 생성).
 
     placeholder: {{measurements}}
     """
-    template_path = tmp_path / "template_measurements.docx"
-
     doc = Document()
     doc.add_heading("검사 성적서", 0)
     doc.add_paragraph("작업번호: {{wo_no}}")
@@ -63,8 +75,16 @@ def template_with_measurements(tmp_path: Path) -> Path:
     # 여기서는 간단히 텍스트로 placeholder만 추가
     doc.add_paragraph("측정 데이터: {{measurements}}")
 
-    doc.save(template_path)
+    return _docx_bytes(doc)
+
 
+@pytest.fixture
+def template_with_measurements(
+    tmp_path: Path, template_with_measurements_bytes: bytes
+) -> Path:
+    """측정 데이터 DOCX 템플릿 (캐시된 바이트를 tmp_path에 기록)."""
+    template_path = tmp_path / "template_measurements.docx"
+    template_path.write_bytes(template_with_measurements_bytes)
     return template_path
 
 
@@ -265,6 +285,83 @@ class TestDocxRendererGetPlaceholders:
 
         assert placeholders == []
 
+    def test_simple_template_skips_docxtpl_load(self, simple_docx_template: Path):
+        """단순 placeholder만 있으면 XML 직접 스캔 (DocxTemplate 로드 안 함)."""
+        renderer = DocxRenderer(simple_docx_template)
+
+        assert renderer.get_placeholders() == ["line", "result", "wo_no"]
+        assert renderer._doc is None
+
+    def test_placeholder_split_across_runs(self, tmp_path: Path):
+        """Word가 run을 쪼갠 placeholder도 추출."""
+        template_path = tmp_path / "split.docx"
+        doc = Document()
+        para = doc.add_paragraph("작업번호: {{")
+        para.add_run("wo_")
+        para.add_run("no}}")
+        doc.save(template_path)
+
+        assert DocxRenderer(template_path).get_placeholders() == ["wo_no"]
+
+    def test_jinja_block_falls_back_to_docxtpl(self, tmp_path: Path):
+        """{% %} 블록이 있으면 docxtpl 분석 사용 (루프 변수는 제외)."""
+        template_path = tmp_path / "loop.docx"
+        doc = Document()
+        doc.add_paragraph("{% for m in measurements %}{{ m.item }}{% endfor %}")
+        doc.save(template_path)
+
+        assert DocxRenderer(template_path).get_placeholders() == ["measurements"]
+
+    def test_matches_docxtpl_with_footnotes(self, tmp_path: Path):
+        """각주/미주는 docxtpl처럼 스캔 대상 아님 (본문/머리글/바닥글만)."""
+        doc = Document()
+        doc.add_paragraph("작업번호: {{wo_no}}")
+        doc.sections[0].header.paragraphs[0].text = "{{ header_var }}"
+        doc.sections[0].footer.paragraphs[0].text = "{{ footer_var }}"
+        source = BytesIO(_docx_bytes(doc))
+
+        template_path = tmp_path / "footnotes.docx"
+        with (
+            zipfile.ZipFile(source) as src,
+            zipfile.ZipFile(template_path, "w") as dst,
+        ):
+            for item in src.infolist():
+                dst.writestr(item, src.read(item))
+            for part in ("footnotes", "endnotes"):
+                dst.writestr(
+                    f"word/{part}.xml",
+                    '<w:footnotes xmlns:w="http://schemas.openxmlformats.org/'
+                    'wordprocessingml/2006/main"><w:footnote><w:p><w:r>'
+                    f"<w:t>{{{{ {part}_var }}}}</w:t></w:r></w:p></w:footnote>"
+                    "</w:footnotes>",
+                )
+
+        renderer = DocxRenderer(template_path)
+        expected = DocxTemplate(template_path).get_undeclared_template_variables()
+
+        assert renderer.get_placeholders() == sorted(expected)
+        assert renderer.get_placeholders() == ["footer_var", "header_var", "wo_no"]
+        assert renderer._doc is None
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "{{ '{{ not_a_var }}' }} {{ wo_no }}",
+            "{% raw %}{{ not_a_var }}{% endraw %} {{ wo_no }}",
+        ],
+    )
+    def test_literal_and_raw_match_docxtpl(self, tmp_path: Path, text: str):
+        """문자열 리터럴/raw 블록 안의 {{ }}는 변수로 보고하지 않음 (docxtpl과 동일)."""
+        template_path = tmp_path / "literal.docx"
+        doc = Document()
+        doc.add_paragraph(text)
+        doc.save(template_path)
+
+        expected = DocxTemplate(template_path).get_undeclared_template_variables()
+
+        assert DocxRenderer(template_path).get_placeholders() == sorted(expected)
+        assert sorted(expected) == ["wo_no"]
+
 
 # =============================================================================
 # render_docx 간편 함수 테스트
@@ -315,3 +412,50 @@ class TestRenderDocx:
         )
 
         assert result == output_path
+
+
+# =============================================================================
+# render_docx_many 병렬 렌더링 테스트
+# =============================================================================
+
+
+class TestRenderDocxMany:
+    """render_docx_many (프로세스 풀) 테스트."""
+
+    def test_renders_all_in_order(
+        self,
+        simple_docx_template: Path,
+        sample_render_data: dict,
+        tmp_path: Path,
+    ):
+        """모든 작업 렌더링, 결과는 jobs 순서."""
+        jobs = [
+            (
+                simple_docx_template,
+                {**sample_render_data, "wo_no": f"WO-{i:03d}"},
+                tmp_path / f"out_{i}.docx",
+            )
+            for i in range(3)
+        ]
+
+        results = render_docx_many(jobs, max_workers=2)
+
+        assert results == [out for _, _, out in jobs]
+        for i, (_, _, out) in enumerate(jobs):
+            texts = [p.text for p in Document(out).paragraphs]
+            assert f"작업번호: WO-{i:03d}" in texts
+
+    def test_empty_jobs(self):
+        """작업이 없으면 풀 생성 없이 빈 목록."""
+        assert render_docx_many([]) == []
+
+    def test_worker_error_propagates(self, sample_render_data: dict, tmp_path: Path):
+        """워커의 RENDER_FAILED가 code/context 그대로 전달됨."""
+        broken = tmp_path / "broken.docx"
+        broken.write_bytes(b"not a docx")
+
+        with pytest.raises(PolicyRejectError) as exc_info:
+            render_docx_many([(broken, sample_render_data, tmp_path / "out.docx")])
+
+        assert exc_info.value.code == ErrorCodes.RENDER_FAILED
+        assert exc_info.value.context["template"] == str(broken)
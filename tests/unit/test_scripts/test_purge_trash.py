@@ -109,6 +109,32 @@ class TestRetentionDaysPurge:
         assert result.purged_folders == 0
         assert len(list(trash_dir.iterdir())) == 3
 
+    def test_scan_counts_accumulated(self, job_dir: Path, trash_dir: Path):
+        """스캔 통계 (폴더/파일/용량) 집계 및 삭제 파일 수."""
+        old_name = (datetime.now() - timedelta(days=40)).strftime(
+            "%Y%m%d_%H%M%S_RUN-OLD"
+        )
+        old_folder = create_archive_folder(trash_dir, old_name, size_kb=4)
+        (old_folder / "sub").mkdir()
+        (old_folder / "sub" / "extra.jpg").write_bytes(b"y" * 1024)
+        new_name = (datetime.now() - timedelta(days=1)).strftime(
+            "%Y%m%d_%H%M%S_RUN-NEW"
+        )
+        create_archive_folder(trash_dir, new_name, size_kb=2)
+        (trash_dir / "stray.txt").write_text("not a folder")
+
+        config = TrashRetentionConfig(retention_days=30, purge_mode="delete")
+
+        result = PurgeResult()
+        purge_job_trash(job_dir, config, execute=False, result=result)
+
+        assert result.scanned_jobs == 1
+        assert result.scanned_folders == 2
+        assert result.scanned_files == 3
+        assert result.scanned_size_mb == pytest.approx(7 / 1024)
+        assert result.purged_folders == 1
+        assert result.purged_files == 2
+
 
 # =============================================================================
 # TC2: max_size_per_job_mb 초과 시 오래된 것부터 purge
@@ -286,6 +312,18 @@ class TestHelperFunctions:
         size = get_folder_size(folder)
         assert size == 1500
 
+    def test_get_folder_size_nested(self, tmp_path: Path):
+        """하위 디렉터리 포함 크기 계산, 없는 폴더는 0."""
+        folder = tmp_path / "test_folder"
+        (folder / "a" / "b").mkdir(parents=True)
+
+        (folder / "file1.txt").write_bytes(b"x" * 100)
+        (folder / "a" / "file2.txt").write_bytes(b"y" * 20)
+        (folder / "a" / "b" / "file3.txt").write_bytes(b"z" * 3)
+
+        assert get_folder_size(folder) == 123
+        assert get_folder_size(tmp_path / "missing") == 0
+
     def test_get_folder_mtime_from_name(self, tmp_path: Path):
         """폴더명에서 날짜 파싱."""
         folder = tmp_path / "20240115_093000_RUN-001"
@@ -298,6 +336,17 @@ class TestHelperFunctions:
         assert mtime.hour == 9
         assert mtime.minute == 30
 
+    def test_get_folder_mtime_falls_back_to_stat(self, tmp_path: Path):
+        """날짜 형식이 아니거나 범위 밖(13월)이면 실제 mtime 사용."""
+        import os
+
+        for name in ["20241301_093000_RUN-001", "RUN-001"]:
+            folder = tmp_path / name
+            folder.mkdir()
+            os.utime(folder, (1_700_000_000, 1_700_000_000))
+
+            assert get_folder_mtime(folder) == datetime.fromtimestamp(1_700_000_000)
+
     def test_compress_folder_creates_archive(self, tmp_path: Path):
         """폴더 압축 함수."""
         source = tmp_path / "source_folder"
@@ -310,3 +359,45 @@ class TestHelperFunctions:
         assert archive_path is not None
         assert archive_path.exists()
         assert archive_path.suffix == ".gz"
+
+    def test_compress_folder_via_pigz_pipe(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """pigz가 있으면 파이프로 압축 (gzip -1 -c로 대체해 동일 포맷 검증)."""
+        import shutil
+
+        gzip_bin = shutil.which("gzip")
+        if gzip_bin is None:
+            pytest.skip("gzip binary not available")
+        monkeypatch.setattr(
+            "purge_trash.shutil.which",
+            lambda name: gzip_bin if name == "pigz" else None,
+        )
+
+        source = tmp_path / "source_folder"
+        source.mkdir()
+        (source / "test.txt").write_text("hello")
+
+        archive_path = compress_folder(source, tmp_path / "archives")
+
+        assert archive_path is not None
+        with tarfile.open(archive_path, "r:gz") as tar:
+            assert "source_folder/test.txt" in tar.getnames()
+
+    def test_compress_failure_removes_partial_archive(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """압축 중 실패 시 불완전한 아카이브를 남기지 않음."""
+
+        def _fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("purge_trash.shutil.which", lambda name: None)
+        monkeypatch.setattr(tarfile.TarFile, "add", _fail)
+
+        source = tmp_path / "source_folder"
+        source.mkdir()
+        archive_dir = tmp_path / "archives"
+
+        assert compress_folder(source, archive_dir) is None
+        assert list(archive_dir.iterdir()) == []
@@ -8,8 +8,11 @@ ADR-0002 검증:
 - 상태: draft → ready → archived
 """
 
+import json
+import os
 import stat
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -18,6 +21,7 @@ from src.templates.manager import (
     TemplateManager,
     TemplateMeta,
     TemplateStatus,
+    _clear_readonly_and_retry,
     validate_template_id,
 )
 
@@ -113,6 +117,9 @@ class TestValidateTemplateId:
             "customer>a",  # >
             "customer|a",  # |
             "customer a",  # 공백
+            "customer\ta",  # 탭
+            "customer\na",  # 개행
+            "customer\ra",  # 캐리지 리턴
         ]
 
         for tid in forbidden_ids:
@@ -122,6 +129,25 @@ class TestValidateTemplateId:
             assert exc_info.value.code == "INVALID_TEMPLATE_ID"
             assert "forbidden" in exc_info.value.message.lower()
 
+    def test_forbidden_characters_at_edges(self):
+        """앞/뒤 금지 문자 → 형식 에러가 아닌 금지 문자 에러 (forbidden 컨텍스트)."""
+        cases = {
+            "/etc": ["/"],
+            "a:": [":"],
+            "*x": ["*"],
+            "customer_a ": [" "],
+            "\tcustomer": ["\t"],
+            "customer\n": ["\n"],
+        }
+
+        for tid, forbidden in cases.items():
+            with pytest.raises(TemplateError) as exc_info:
+                validate_template_id(tid)
+
+            assert exc_info.value.code == "INVALID_TEMPLATE_ID"
+            assert "forbidden" in exc_info.value.message.lower()
+            assert exc_info.value.context["forbidden"] == forbidden
+
     def test_uppercase_not_allowed(self):
         """대문자 → 에러."""
         with pytest.raises(TemplateError) as exc_info:
@@ -150,6 +176,29 @@ class TestValidateTemplateId:
 
         assert exc_info.value.code == "INVALID_TEMPLATE_ID"
 
+    def test_non_ascii_not_allowed(self):
+        """비ASCII 소문자/숫자 → 에러 (str.islower/isdigit 기준이 아님)."""
+        for tid in ["café_a", "customer_²", "ｃustomer"]:
+            with pytest.raises(TemplateError) as exc_info:
+                validate_template_id(tid)
+
+            assert exc_info.value.code == "INVALID_TEMPLATE_ID"
+
+    @pytest.mark.parametrize("template_id", [None, 123, b"customer_a", ["a", "b"]])
+    def test_non_string_raises_template_error(self, template_id):
+        """문자열이 아닌 입력 → TypeError가 아닌 TemplateError."""
+        with pytest.raises(TemplateError) as exc_info:
+            validate_template_id(template_id)
+
+        assert exc_info.value.code == "INVALID_TEMPLATE_ID"
+
+    def test_trailing_newline_not_allowed(self):
+        """끝 개행 → 에러 (정규식 "$"가 개행 앞에서 매칭되지 않도록)."""
+        with pytest.raises(TemplateError) as exc_info:
+            validate_template_id("customer_a\n")
+
+        assert exc_info.value.code == "INVALID_TEMPLATE_ID"
+
 
 # =============================================================================
 # TemplateManager.create 테스트
@@ -204,6 +253,39 @@ class TestTemplateManagerCreate:
         assert meta.description == "설명입니다"
         assert meta.status == TemplateStatus.DRAFT
 
+    def test_default_manifest_round_trip(
+        self,
+        manager: TemplateManager,
+    ):
+        """기본 manifest.yaml → 다시 읽으면 같은 내용 (특수 문자 doc_type 포함)."""
+        doc_type = '검사: "성적서"'
+        manager.create("test_manifest", doc_type, "테스트", "user1")
+
+        manifest = manager.get_manifest("test_manifest")
+
+        assert manifest == manager._default_manifest("test_manifest", doc_type)
+
+    def test_meta_json_written_atomically(
+        self,
+        manager: TemplateManager,
+    ):
+        """meta.json → temp 파일 없이 완성된 UTF-8 JSON으로 저장."""
+        template_path = manager.create("test_atomic", "inspection", "테스트", "user1")
+
+        meta_path = template_path / "meta.json"
+        raw = meta_path.read_bytes()
+        assert json.loads(raw)["display_name"] == "테스트"
+        assert "테스트".encode() in raw  # ensure_ascii=False 유지
+        assert not list(template_path.glob("*.tmp"))
+
+        # manifest.yaml과 같은 일반 파일 권한 (0o666 & ~umask)
+        umask = os.umask(0)
+        os.umask(umask)
+        assert meta_path.stat().st_mode & 0o777 == 0o666 & ~umask
+        assert meta_path.stat().st_mode & 0o777 == (
+            (template_path / "manifest.yaml").stat().st_mode & 0o777
+        )
+
     def test_duplicate_id_raises_error(
         self,
         manager: TemplateManager,
@@ -306,6 +388,19 @@ class TestTemplateManagerSaveSource:
 
         assert (mode & 0o777) == expected
 
+    def test_failed_write_allows_retry(
+        self,
+        manager: TemplateManager,
+        sample_template: str,
+    ):
+        """쓰기 실패 → 불완전한 파일 삭제 → 재시도 가능."""
+        with pytest.raises(TypeError):
+            manager.save_source(sample_template, "not bytes", "file.docx")  # type: ignore[arg-type]
+
+        path = manager.save_source(sample_template, b"content", "file.docx")
+
+        assert path.read_bytes() == b"content"
+
     def test_overwrite_raises_error(
         self,
         manager: TemplateManager,
@@ -412,6 +507,29 @@ class TestTemplateManagerUpdateStatus:
 
         assert meta.status == TemplateStatus.ARCHIVED
 
+    def test_get_meta_reflects_update(
+        self,
+        manager: TemplateManager,
+        sample_template: str,
+    ):
+        """캐시된 meta → 상태 변경 후 get_meta에 반영."""
+        assert manager.get_meta(sample_template).status == TemplateStatus.DRAFT
+
+        manager.update_status(sample_template, TemplateStatus.READY)
+
+        assert manager.get_meta(sample_template).status == TemplateStatus.READY
+
+    def test_get_meta_returns_copy(
+        self,
+        manager: TemplateManager,
+        sample_template: str,
+    ):
+        """반환된 meta 수정 → 캐시에 영향 없음."""
+        meta = manager.get_meta(sample_template)
+        meta.display_name = "changed"
+
+        assert manager.get_meta(sample_template).display_name != "changed"
+
 
 # =============================================================================
 # TemplateManager.list_templates 테스트
@@ -453,6 +571,47 @@ class TestTemplateManagerListTemplates:
         assert len(ready) == 1
         assert ready[0].template_id == "draft_2"
 
+    def test_reflects_changes_from_other_manager(
+        self,
+        manager: TemplateManager,
+        templates_root: Path,
+    ):
+        """다른 인스턴스의 상태 변경 → 캐시된 목록에도 반영."""
+        manager.create("draft_1", "inspection", "Draft 1", "user1")
+        assert len(manager.list_templates(status=TemplateStatus.DRAFT)) == 1
+
+        TemplateManager(templates_root).update_status(
+            "draft_1", TemplateStatus.READY, reviewed_by="reviewer1"
+        )
+
+        assert manager.list_templates(status=TemplateStatus.DRAFT) == []
+        ready = manager.list_templates(status=TemplateStatus.READY)
+        assert [t.template_id for t in ready] == ["draft_1"]
+
+    def test_base_manifest_only_and_invalid_meta(
+        self,
+        manager: TemplateManager,
+        templates_root: Path,
+    ):
+        """manifest만 있는 base → READY, 깨진 meta.json/숨김 폴더 → 제외."""
+        base_dir = templates_root / "base" / "base_inspection"
+        base_dir.mkdir()
+        (base_dir / "manifest.yaml").write_text(
+            "template_id: base_inspection\ndoc_type: inspection\n",
+            encoding="utf-8",
+        )
+        broken_dir = templates_root / "custom" / "broken"
+        broken_dir.mkdir(parents=True)
+        (broken_dir / "meta.json").write_text("{not json", encoding="utf-8")
+        (templates_root / "custom" / ".hidden").mkdir()
+        manager.create("template_a", "inspection", "Template A", "user1")
+
+        templates = manager.list_templates(category="all")
+
+        by_id = {t.template_id: t for t in templates}
+        assert set(by_id) == {"base_inspection", "template_a"}
+        assert by_id["base_inspection"].status == TemplateStatus.READY
+
 
 # =============================================================================
 # TemplateManager.delete 테스트
@@ -510,6 +669,43 @@ class TestTemplateManagerDelete:
 
         manager.delete(sample_template)  # 에러 없이 삭제
 
+    def test_readonly_handler_clears_and_retries(self, tmp_path: Path):
+        """rmtree 에러 핸들러 → 쓰기 권한 부여 후 같은 함수 재시도."""
+        target = tmp_path / "readonly.docx"
+        target.write_bytes(b"content")
+        target.chmod(0o444)
+
+        _clear_readonly_and_retry(os.remove, str(target), None)
+
+        assert not target.exists()
+
+    def test_readonly_handler_keeps_dir_traversable(self, tmp_path: Path):
+        """디렉토리는 실행 권한도 부여 (하위 항목 탐색 가능)."""
+        target = tmp_path / "readonly_dir"
+        target.mkdir()
+        target.chmod(0o555)
+
+        with patch("os.chmod", wraps=os.chmod) as mock_chmod:
+            _clear_readonly_and_retry(os.rmdir, str(target), None)
+
+        assert mock_chmod.call_args.args[1] & stat.S_IEXEC
+        assert not target.exists()
+
+    @pytest.mark.parametrize("func", [os.open, os.scandir, os.lstat])
+    def test_readonly_handler_reraises_non_remove_errors(self, func, tmp_path: Path):
+        """삭제 함수가 아닌 실패 → 재시도 없이 원래 예외 (onexc/onerror 모두)."""
+        error = PermissionError("denied")
+
+        with pytest.raises(PermissionError) as exc_info:
+            _clear_readonly_and_retry(func, str(tmp_path), error)
+        assert exc_info.value is error
+
+        with pytest.raises(PermissionError) as exc_info:
+            _clear_readonly_and_retry(
+                func, str(tmp_path), (PermissionError, error, None)
+            )
+        assert exc_info.value is error
+
 
 # =============================================================================
 # TemplateMeta 테스트
@@ -546,3 +742,15 @@ class TestTemplateMeta:
 
         assert meta.template_id == "test"
         assert meta.status == TemplateStatus.READY
+
+    def test_from_dict_invalid_status(self):
+        """알 수 없는 상태 문자열 → ValueError."""
+        d = {
+            "template_id": "test",
+            "doc_type": "inspection",
+            "display_name": "테스트",
+            "status": "published",
+        }
+
+        with pytest.raises(ValueError):
+            TemplateMeta.from_dict(d)
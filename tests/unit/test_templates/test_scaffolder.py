@@ -13,6 +13,7 @@ import pytest
 import yaml
 
 from src.templates.scaffolder import (
+    LABEL_VALUE_MAX_LENGTH,
     DetectedField,
     ScaffoldLevel,
     ScaffoldResult,
@@ -20,6 +21,7 @@ from src.templates.scaffolder import (
     analyze_example_document,
     detect_labels_rule_based,
     detect_placeholders,
+    has_measurement_keywords,
     has_placeholders,
 )
 
@@ -112,6 +114,25 @@ class TestHasPlaceholders:
         """placeholder 없으면 False."""
         assert not has_placeholders("Hello World")
 
+    def test_returns_false_for_unclosed_braces(self):
+        """여는 중괄호만 있고 완성된 placeholder가 없으면 False."""
+        assert not has_placeholders("Hello {{ World")
+        assert not has_placeholders("{{}}")
+
+
+class TestHasMeasurementKeywords:
+    """has_measurement_keywords 함수 테스트."""
+
+    def test_detects_keywords(self):
+        """영문(대소문자 무시)/한글 키워드 감지."""
+        assert has_measurement_keywords("항목 | Spec | Measured")
+        assert has_measurement_keywords("측정값 기록")
+        assert has_measurement_keywords("규격: 10±0.1")
+
+    def test_returns_false(self):
+        """키워드 없으면 False."""
+        assert not has_measurement_keywords("WO No.: WO-001\nLine: L1")
+
 
 # =============================================================================
 # detect_labels_rule_based 테스트
@@ -188,6 +209,46 @@ class TestDetectLabelsRuleBased:
 
         assert all(f.confidence == 0.7 for f in detected)
 
+    def test_multiple_labels_on_one_line(self):
+        """한 줄의 여러 라벨 → 필드별로 각각 감지 (패턴 순서)."""
+        text = "WO No.: WO-001 Line: L1\nInspector: 홍길동"
+
+        detected = detect_labels_rule_based(text)
+
+        assert [(f.field_name, f.original_value) for f in detected] == [
+            ("wo_no", "WO-001 Line: L1"),
+            ("line", "L1"),
+            ("inspector", "홍길동"),
+        ]
+
+    def test_value_length_bounded(self):
+        """값 길이 상한 (LABEL_VALUE_MAX_LENGTH)."""
+        text = "Line: " + "x" * 500
+
+        detected = detect_labels_rule_based(text)
+
+        line_field = next(f for f in detected if f.field_name == "line")
+        assert line_field.original_value == "x" * LABEL_VALUE_MAX_LENGTH
+
+    def test_custom_patterns(self):
+        """사용자 지정 패턴 → 기본 패턴 대신 사용."""
+        text = "Shift: B\nLine: L1"
+
+        detected = detect_labels_rule_based(text, {r"(?:Shift|근무조)": "shift"})
+
+        assert [(f.field_name, f.original_value) for f in detected] == [("shift", "B")]
+
+    def test_custom_patterns_may_overlap(self):
+        """겹치는 사용자 패턴 → 패턴별로 모두 감지 (다른 라벨 안의 라벨 포함)."""
+        detected = detect_labels_rule_based(
+            "Lot No: 5", {"Lot": "lot", r"Lot\s*No": "lot_no"}
+        )
+
+        assert [(f.field_name, f.original_value) for f in detected] == [
+            ("lot", "No: 5"),
+            ("lot_no", "5"),
+        ]
+
 
 # =============================================================================
 # TemplateScaffolder.analyze_document 테스트
@@ -230,6 +291,19 @@ class TestTemplateScaffolderAnalyze:
         assert result.level == ScaffoldLevel.AUTO
         assert any("unknown" in w.lower() for w in result.warnings)
 
+    def test_level1_unknown_placeholders_listed_once(
+        self, scaffolder: TemplateScaffolder
+    ):
+        """Level 1: 중복 unknown placeholder는 경고에 한 번만 (정렬)."""
+        text = "{{zeta}} {{wo_no}} {{alpha}} {{zeta}}"
+
+        result = scaffolder.analyze_document(text)
+
+        assert result.warnings == [
+            "Unknown placeholders (not in definition.yaml): ['alpha', 'zeta']"
+        ]
+        assert [f.field_name for f in result.detected_fields] == ["wo_no"]
+
     def test_level2_without_placeholders(self, scaffolder: TemplateScaffolder):
         """
         Level 2 (반자동): placeholder가 없으면.
@@ -265,6 +339,16 @@ class TestTemplateScaffolderAnalyze:
         assert "line" in detected_names
         assert "inspector" in detected_names
 
+    def test_level2_value_on_next_line(self, scaffolder: TemplateScaffolder):
+        """Level 2: 라벨과 값이 다른 줄에 있어도 감지 (줄 단위 분할 안 함)."""
+        text = "검사자:\n홍길동\nWO No.\nWO-001"
+
+        result = scaffolder.analyze_document(text)
+
+        values = {f.field_name: f.original_value for f in result.detected_fields}
+        assert values["inspector"] == "홍길동"
+        assert values["wo_no"] == "WO-001"
+
     def test_level2_warns_missing_critical(self, scaffolder: TemplateScaffolder):
         """Level 2: critical 필드 누락 경고."""
         text = """
@@ -276,6 +360,10 @@ class TestTemplateScaffolderAnalyze:
         result = scaffolder.analyze_document(text)
 
         assert any("critical" in w.lower() for w in result.warnings)
+        assert (
+            "Critical fields not detected: ['line', 'lot', 'part_no', 'result']"
+            in result.warnings
+        )
 
     def test_detects_measurements_table(self, scaffolder: TemplateScaffolder):
         """측정 테이블 감지."""
@@ -292,6 +380,65 @@ class TestTemplateScaffolderAnalyze:
         assert result.detected_measurements is True
 
 
+class TestDefinitionCache:
+    """definition.yaml 캐시 테스트."""
+
+    def test_shared_across_instances(self, sample_definition: Path):
+        """같은 파일 → 인스턴스가 달라도 파싱 결과 재사용."""
+        first = TemplateScaffolder(sample_definition)
+        second = TemplateScaffolder(sample_definition)
+
+        assert first.definition is second.definition
+
+    def test_reloads_after_change(self, sample_definition: Path):
+        """파일 변경 → 새 인스턴스는 변경된 정의 사용."""
+        before = TemplateScaffolder(sample_definition)
+        assert "extra" not in before.definition["fields"]
+
+        definition = yaml.safe_load(sample_definition.read_text(encoding="utf-8"))
+        definition["fields"] = {
+            **definition["fields"],
+            "extra": {"type": "token", "importance": "critical"},
+        }
+        with open(sample_definition, "w", encoding="utf-8") as f:
+            yaml.dump(definition, f, allow_unicode=True)
+
+        after = TemplateScaffolder(sample_definition)
+        result = after.analyze_document("WO No.: WO-001")
+
+        assert "extra" in after.definition["fields"]
+        assert any("extra" in w for w in result.warnings)
+
+    def test_shared_definition_is_read_only(self, sample_definition: Path):
+        """캐시 공유 정의는 수정 불가 (다른 인스턴스 오염 방지)."""
+        scaffolder = TemplateScaffolder(sample_definition)
+
+        with pytest.raises(TypeError):
+            scaffolder.definition["fields"]["extra"] = {}
+        with pytest.raises(TypeError):
+            scaffolder.definition["fields"]["wo_no"]["importance"] = "optional"
+
+        assert "extra" not in TemplateScaffolder(sample_definition).definition["fields"]
+
+    async def test_llm_extractor_gets_mutable_copy(self, sample_definition: Path):
+        """LLM 추출기는 독립 사본을 받음 (수정해도 캐시 영향 없음)."""
+
+        class MutatingExtractor:
+            async def extract_fields(self, document_text, field_definitions):
+                field_definitions["wo_no"]["importance"] = "optional"
+                field_definitions.pop("line")
+                return []
+
+        scaffolder = TemplateScaffolder(
+            sample_definition, llm_extractor=MutatingExtractor()
+        )
+        await scaffolder.scaffold_with_llm("WO No.: WO-001")
+
+        fields = TemplateScaffolder(sample_definition).definition["fields"]
+        assert fields["wo_no"]["importance"] == "critical"
+        assert "line" in fields
+
+
 # =============================================================================
 # ScaffoldResult 테스트
 # =============================================================================